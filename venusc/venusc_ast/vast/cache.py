@@ -0,0 +1,29 @@
+"""
+Memoization helpers for repeated AST queries.
+
+`DottedIdentifierExpr` nodes store their flattened segment path
+directly, so the flattening query is a plain attribute read. The
+helper below remains as the stable entry point for name analysis and
+import resolution.
+"""
+
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from vast.expr import DottedIdentifierExpr
+
+
+def flatten_dotted_identifier(
+    expr: DottedIdentifierExpr,
+) -> tuple[str, ...]:
+    """
+    Return the tuple of segment lexemes of `expr`.
+
+    Returns
+    -------
+    (str, ...)
+    """
+
+    return expr.path
@@ -0,0 +1,100 @@
+"""
+Precomputed dispatch tables for AST visitors.
+
+Traversing the tree through `node.accept(visitor)` costs two Python-level
+calls per node. The `visit` driver below performs the same double dispatch
+with a single call by indexing a per-visitor-class method table with the
+node's `NODE_KIND` tag.
+"""
+
+from __future__ import annotations
+
+import functools
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from vast.node import AstNode
+    from vast.node import AstVisitor
+
+# Method names indexed by `NODE_KIND`. Expression kinds come first,
+# statement kinds last; the numbering must stay in sync with the
+# `NODE_KIND` constants in `expr.py` and `stmt.py`.
+VISIT_METHOD_NAMES: typing.Final = (
+    "visit_annotated_expr",
+    "visit_application_expr",
+    "visit_case_expr",
+    "visit_dotted_identifier_expr",
+    "visit_grouping_expr",
+    "visit_identifier_expr",
+    "visit_if_expr",
+    "visit_infix_expr",
+    "visit_list_expr",
+    "visit_literal_expr",
+    "visit_match_expr",
+    "visit_prefix_expr",
+    "visit_relation_expr",
+    "visit_tuple_expr",
+    "visit_fix_stmt",
+    "visit_let_stmt",
+    "visit_use_stmt",
+)
+
+
+@functools.cache
+def get_dispatch_table(
+    visitor_type: type,
+) -> tuple[Callable[..., typing.Any], ...]:
+    """
+    Build (once per visitor class) the `NODE_KIND`-indexed method table.
+
+    Returns
+    -------
+    The tuple of unbound visit methods of `visitor_type`.
+    """
+
+    return tuple(getattr(visitor_type, name) for name in VISIT_METHOD_NAMES)
+
+
+def visit[R](visitor: AstVisitor[R], node: AstNode) -> R:
+    """
+    Dispatch `node` to the matching visit method of `visitor`.
+
+    Equivalent to `node.accept(visitor)`, but without going through the
+    node's `accept` method.
+
+    Returns
+    -------
+    Whatever the visit method returns.
+    """
+
+    return get_dispatch_table(type(visitor))[node.NODE_KIND](visitor, node)
+
+
+class CompilerVisitorBase[R]:
+    """
+    Base class for AST visitors that dispatch through a bound-method table.
+
+    The table is built once at construction, so the hot path is a tuple
+    index followed by a plain call — no `__getattribute__`/MRO walk per
+    node.
+    """
+
+    __slots__ = ("_dispatch",)
+
+    def __init__(self) -> None:
+        self._dispatch: tuple[Callable[[AstNode], R], ...] = tuple(
+            getattr(self, name) for name in VISIT_METHOD_NAMES
+        )
+
+    def visit(self, node: AstNode) -> R:
+        """
+        Dispatch `node` to the matching bound visit method.
+
+        Returns
+        -------
+        Whatever the visit method returns.
+        """
+
+        return self._dispatch[node.NODE_KIND](node)
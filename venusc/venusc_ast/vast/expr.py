@@ -4,17 +4,21 @@ Venus expression tree
 
 from __future__ import annotations
 
-import abc
 import typing
 
-import attrs
 import type  # noqa: A004
+from type import TypeVariable
 
 if typing.TYPE_CHECKING:
     import tokens
 
+# Shared sentinel for nodes whose type has not been resolved yet; the
+# identifier -1 carries no identity meaning until unification runs, so
+# one object can serve every node.
+_UNRESOLVED: typing.Final = TypeVariable(-1)
 
-class ExprVisitor[R_co](typing.Protocol):
+
+class ExprVisitor[R_co]:
     """
     Interface for visiting the expression tree.
     """
@@ -23,107 +27,132 @@ class ExprVisitor[R_co](typing.Protocol):
         """
         Visit an annotated expression.
         """
-        ...
+        raise NotImplementedError
 
     def visit_application_expr(self, expr: ApplicationExpr) -> R_co:
         """
         Visit an application expression.
         """
-        ...
+        raise NotImplementedError
 
     def visit_case_expr(self, expr: CaseExpr) -> R_co:
         """
         Visit a case expression.
         """
-        ...
+        raise NotImplementedError
 
     def visit_dotted_identifier_expr(self, expr: DottedIdentifierExpr) -> R_co:
         """
         Visit a dotted identifier expression.
         """
-        ...
+        raise NotImplementedError
 
     def visit_grouping_expr(self, expr: GroupingExpr) -> R_co:
         """
         Visit a grouping expression.
         """
-        ...
+        raise NotImplementedError
 
     def visit_identifier_expr(self, expr: IdentifierExpr) -> R_co:
         """
         Visit an identifier expression.
         """
-        ...
+        raise NotImplementedError
 
     def visit_if_expr(self, expr: IfExpr) -> R_co:
         """
         Visit an if-then-else expression.
         """
-        ...
+        raise NotImplementedError
 
     def visit_infix_expr(self, expr: InfixExpr) -> R_co:
         """
         Visit an infix (operator) expression.
         """
-        ...
+        raise NotImplementedError
 
     def visit_list_expr(self, expr: ListExpr) -> R_co:
         """
         Visit an list literal expression.
         """
-        ...
+        raise NotImplementedError
 
     def visit_literal_expr(self, expr: LiteralExpr) -> R_co:
         """
         Visit an atomic literal expression.
         """
-        ...
+        raise NotImplementedError
 
     def visit_match_expr(self, expr: MatchExpr) -> R_co:
         """
         Visit a match-case-end expression.
         """
-        ...
+        raise NotImplementedError
 
     def visit_prefix_expr(self, expr: PrefixExpr) -> R_co:
         """
         Visit a prefix (operator) expression.
         """
-        ...
+        raise NotImplementedError
 
     def visit_relation_expr(self, expr: RelationExpr) -> R_co:
         """
         Visit a relation expression.
         """
-        ...
+        raise NotImplementedError
 
     def visit_tuple_expr(self, expr: TupleExpr) -> R_co:
         """
         Visit a tuple literal expression.
         """
-        ...
+        raise NotImplementedError
 
 
-@attrs.frozen
-class AbstractExpr(abc.ABC):
+class AbstractExpr:
     """
     Represents an abstract expression node.
+
+    The node kind lives on the class (`NODE_KIND`) and the type variable
+    attached to the node is stored as a bare `type_id` integer, so a
+    freshly parsed node carries no per-instance type object at all.
     """
 
+    __slots__ = ("__weakref__", "span", "type_id")
+
     span: tuple[int, int]
-    type: type.Type = attrs.field(
-        kw_only=True,
-        factory=lambda: type.TypeVariable(-1),
-    )
+    type_id: int
+
+    def __init__(
+        self,
+        span: tuple[int, int],
+        *,
+        type_id: int = -1,
+    ) -> None:
+        self.span = span
+        self.type_id = type_id
+
+    @property
+    def type(self) -> type.Type:
+        """
+        Type variable of the node, materialized on demand.
+
+        Unresolved nodes all share one sentinel object; type-checker
+        passes should read and write `type_id` directly.
+        """
+
+        if self.type_id == -1:
+            return _UNRESOLVED
+
+        return TypeVariable(self.type_id)
 
-    @abc.abstractmethod
     def accept[R](self, visitor: ExprVisitor[R]) -> R:
         """
         Accept an expression visitor.
         """
 
+        raise NotImplementedError
+
 
-@attrs.frozen
 class AnnotatedExpr(AbstractExpr):
     """
     Represents a type-annotated expression.
@@ -133,15 +162,26 @@ class AnnotatedExpr(AbstractExpr):
     ```
     """
 
+    __slots__ = ("annotation", "expr")
+
+    NODE_KIND: typing.ClassVar[int] = 0
+
     expr: Expr
     annotation: Expr
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_annotated_expr(self)
+    def __init__(
+        self,
+        span: tuple[int, int],
+        expr: Expr,
+        annotation: Expr,
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.expr = expr
+        self.annotation = annotation
 
 
-@attrs.frozen
 class ApplicationExpr(AbstractExpr):
     """
     Represents an application (function call) expression.
@@ -151,15 +191,26 @@ class ApplicationExpr(AbstractExpr):
     ```
     """
 
+    __slots__ = ("application", "arguments")
+
+    NODE_KIND: typing.ClassVar[int] = 1
+
     application: Expr
-    arguments: list[Expr]
+    arguments: tuple[Expr, ...]
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_application_expr(self)
+    def __init__(
+        self,
+        span: tuple[int, int],
+        application: Expr,
+        arguments: tuple[Expr, ...],
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.application = application
+        self.arguments = arguments
 
 
-@attrs.frozen
 class CaseExpr(AbstractExpr):
     """
     Represents a case in a match expression.
@@ -169,15 +220,26 @@ class CaseExpr(AbstractExpr):
     ```
     """
 
+    __slots__ = ("branch", "pattern")
+
+    NODE_KIND: typing.ClassVar[int] = 2
+
     pattern: Expr
     branch: Expr
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_case_expr(self)
+    def __init__(
+        self,
+        span: tuple[int, int],
+        pattern: Expr,
+        branch: Expr,
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.pattern = pattern
+        self.branch = branch
 
 
-@attrs.frozen
 class DottedIdentifierExpr(AbstractExpr):
     """
     Represents a dotted identifier expression.
@@ -185,17 +247,32 @@ class DottedIdentifierExpr(AbstractExpr):
     ```
     parent.(...attributes)
     ```
+
+    The segment chain is flattened at parse time: `path` holds the
+    segment lexemes (interned via `sys.intern` by the parser) and
+    `tokens` keeps the source tokens for diagnostics.
     """
 
-    parent: Expr
-    attributes: list[IdentifierExpr]
+    __slots__ = ("path", "tokens")
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_dotted_identifier_expr(self)
+    NODE_KIND: typing.ClassVar[int] = 3
+
+    path: tuple[str, ...]
+    tokens: tuple[tokens.Token, ...]
+
+    def __init__(
+        self,
+        span: tuple[int, int],
+        path: tuple[str, ...],
+        tokens: tuple[tokens.Token, ...],
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.path = path
+        self.tokens = tokens
 
 
-@attrs.frozen
 class GroupingExpr(AbstractExpr):
     """
     Represents a parenthesized expression.
@@ -205,27 +282,45 @@ class GroupingExpr(AbstractExpr):
     ```
     """
 
+    __slots__ = ("grouped",)
+
+    NODE_KIND: typing.ClassVar[int] = 4
+
     grouped: Expr
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_grouping_expr(self)
+    def __init__(
+        self,
+        span: tuple[int, int],
+        grouped: Expr,
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.grouped = grouped
 
 
-@attrs.frozen
 class IdentifierExpr(AbstractExpr):
     """
     Represents an identifier expression.
     """
 
+    __slots__ = ("token",)
+
+    NODE_KIND: typing.ClassVar[int] = 5
+
     token: tokens.Token
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_identifier_expr(self)
+    def __init__(
+        self,
+        span: tuple[int, int],
+        token: tokens.Token,
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.token = token
 
 
-@attrs.frozen
 class IfExpr(AbstractExpr):
     """
     Represents an if-then-else expression.
@@ -237,16 +332,29 @@ class IfExpr(AbstractExpr):
     ```
     """
 
+    __slots__ = ("condition", "else_branch", "then_branch")
+
+    NODE_KIND: typing.ClassVar[int] = 6
+
     condition: Expr
     then_branch: Expr
     else_branch: Expr
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_if_expr(self)
+    def __init__(
+        self,
+        span: tuple[int, int],
+        condition: Expr,
+        then_branch: Expr,
+        else_branch: Expr,
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.condition = condition
+        self.then_branch = then_branch
+        self.else_branch = else_branch
 
 
-@attrs.frozen
 class InfixExpr(AbstractExpr):
     """
     Represents an infix (operator) expression.
@@ -256,16 +364,29 @@ class InfixExpr(AbstractExpr):
     ```
     """
 
+    __slots__ = ("left", "operator", "right")
+
+    NODE_KIND: typing.ClassVar[int] = 7
+
     operator: tokens.Operator
     left: Expr
     right: Expr
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_infix_expr(self)
+    def __init__(
+        self,
+        span: tuple[int, int],
+        operator: tokens.Operator,
+        left: Expr,
+        right: Expr,
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.operator = operator
+        self.left = left
+        self.right = right
 
 
-@attrs.frozen
 class ListExpr(AbstractExpr):
     """
     Represents an expression consisting of a list literal.
@@ -275,27 +396,132 @@ class ListExpr(AbstractExpr):
     ```
     """
 
-    items: list[Expr]
+    __slots__ = ("items",)
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_list_expr(self)
+    NODE_KIND: typing.ClassVar[int] = 8
+
+    items: tuple[Expr, ...]
+
+    def __init__(
+        self,
+        span: tuple[int, int],
+        items: tuple[Expr, ...],
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.items = items
+
+
+class EmptyListExpr(AbstractExpr):
+    """
+    Specialization of `ListExpr` for the empty list literal.
+
+    Visitors receive it through `visit_list_expr`.
+    """
+
+    __slots__ = ()
+
+    NODE_KIND: typing.ClassVar[int] = 8
+
+    @property
+    def items(self) -> tuple[Expr, ...]:
+        """
+        Items of the list literal.
+        """
+
+        return ()
+
+
+class SingletonListExpr(AbstractExpr):
+    """
+    Specialization of `ListExpr` for one-item list literals.
+
+    Visitors receive it through `visit_list_expr`.
+    """
+
+    __slots__ = ("item0",)
+
+    NODE_KIND: typing.ClassVar[int] = 8
+
+    item0: Expr
+
+    def __init__(
+        self,
+        span: tuple[int, int],
+        item0: Expr,
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.item0 = item0
+
+    @property
+    def items(self) -> tuple[Expr, ...]:
+        """
+        Items of the list literal.
+        """
+
+        return (self.item0,)
+
+
+class PairListExpr(AbstractExpr):
+    """
+    Specialization of `ListExpr` for two-item list literals.
+
+    Visitors receive it through `visit_list_expr`.
+    """
+
+    __slots__ = ("item0", "item1")
+
+    NODE_KIND: typing.ClassVar[int] = 8
+
+    item0: Expr
+    item1: Expr
+
+    def __init__(
+        self,
+        span: tuple[int, int],
+        item0: Expr,
+        item1: Expr,
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.item0 = item0
+        self.item1 = item1
+
+    @property
+    def items(self) -> tuple[Expr, ...]:
+        """
+        Items of the list literal.
+        """
+
+        return (self.item0, self.item1)
 
 
-@attrs.frozen
 class LiteralExpr(AbstractExpr):
     """
     Represents an atomic literal expression.
     """
 
+    __slots__ = ("token",)
+
+    NODE_KIND: typing.ClassVar[int] = 9
+
     token: tokens.Token
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_literal_expr(self)
+    def __init__(
+        self,
+        span: tuple[int, int],
+        token: tokens.Token,
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.token = token
 
 
-@attrs.frozen
 class MatchExpr(AbstractExpr):
     """
     Represents a match-case-end expression.
@@ -307,15 +533,26 @@ class MatchExpr(AbstractExpr):
     ```
     """
 
+    __slots__ = ("cases", "matched")
+
+    NODE_KIND: typing.ClassVar[int] = 10
+
     matched: Expr
-    cases: list[CaseExpr]
+    cases: tuple[CaseExpr, ...]
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_match_expr(self)
+    def __init__(
+        self,
+        span: tuple[int, int],
+        matched: Expr,
+        cases: tuple[CaseExpr, ...],
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.matched = matched
+        self.cases = cases
 
 
-@attrs.frozen
 class PrefixExpr(AbstractExpr):
     """
     Represents a prefix (operator) expression.
@@ -325,15 +562,26 @@ class PrefixExpr(AbstractExpr):
     ```
     """
 
+    __slots__ = ("operator", "right")
+
+    NODE_KIND: typing.ClassVar[int] = 11
+
     operator: tokens.Operator
     right: Expr
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_prefix_expr(self)
+    def __init__(
+        self,
+        span: tuple[int, int],
+        operator: tokens.Operator,
+        right: Expr,
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.operator = operator
+        self.right = right
 
 
-@attrs.frozen
 class RelationExpr(AbstractExpr):
     """
     Represents a relation expression.
@@ -343,16 +591,29 @@ class RelationExpr(AbstractExpr):
     ```
     """
 
+    __slots__ = ("left", "operator", "right")
+
+    NODE_KIND: typing.ClassVar[int] = 12
+
     operator: tokens.Relation
     left: Expr
     right: Expr
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_relation_expr(self)
+    def __init__(
+        self,
+        span: tuple[int, int],
+        operator: tokens.Relation,
+        left: Expr,
+        right: Expr,
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.operator = operator
+        self.left = left
+        self.right = right
 
 
-@attrs.frozen
 class TupleExpr(AbstractExpr):
     """
     Represents an expression consisting of a tuple literal.
@@ -362,11 +623,169 @@ class TupleExpr(AbstractExpr):
     ```
     """
 
-    items: list[Expr]
+    __slots__ = ("items",)
 
-    @typing.override
-    def accept[R](self, visitor: ExprVisitor[R]) -> R:
-        return visitor.visit_tuple_expr(self)
+    NODE_KIND: typing.ClassVar[int] = 13
+
+    items: tuple[Expr, ...]
+
+    def __init__(
+        self,
+        span: tuple[int, int],
+        items: tuple[Expr, ...],
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.items = items
+
+
+class EmptyTupleExpr(AbstractExpr):
+    """
+    Specialization of `TupleExpr` for the empty tuple literal.
+
+    Visitors receive it through `visit_tuple_expr`.
+    """
+
+    __slots__ = ()
+
+    NODE_KIND: typing.ClassVar[int] = 13
+
+    @property
+    def items(self) -> tuple[Expr, ...]:
+        """
+        Items of the tuple literal.
+        """
+
+        return ()
+
+
+class SingletonTupleExpr(AbstractExpr):
+    """
+    Specialization of `TupleExpr` for one-item tuple literals.
+
+    Visitors receive it through `visit_tuple_expr`.
+    """
+
+    __slots__ = ("item0",)
+
+    NODE_KIND: typing.ClassVar[int] = 13
+
+    item0: Expr
+
+    def __init__(
+        self,
+        span: tuple[int, int],
+        item0: Expr,
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.item0 = item0
+
+    @property
+    def items(self) -> tuple[Expr, ...]:
+        """
+        Items of the tuple literal.
+        """
+
+        return (self.item0,)
+
+
+class PairTupleExpr(AbstractExpr):
+    """
+    Specialization of `TupleExpr` for two-item tuple literals.
+
+    Visitors receive it through `visit_tuple_expr`.
+    """
+
+    __slots__ = ("item0", "item1")
+
+    NODE_KIND: typing.ClassVar[int] = 13
+
+    item0: Expr
+    item1: Expr
+
+    def __init__(
+        self,
+        span: tuple[int, int],
+        item0: Expr,
+        item1: Expr,
+        *,
+        type_id: int = -1,
+    ) -> None:
+        super().__init__(span, type_id=type_id)
+        self.item0 = item0
+        self.item1 = item1
+
+    @property
+    def items(self) -> tuple[Expr, ...]:
+        """
+        Items of the tuple literal.
+        """
+
+        return (self.item0, self.item1)
+
+
+# `accept` is textually identical across the concrete classes modulo
+# the visit method name, so compile it once per class here instead of
+# spelling out twenty copies above. The size-specialized list and tuple
+# literal classes forward to the same visit methods as their general
+# forms.
+for _class, _visit_name in (
+    (AnnotatedExpr, "visit_annotated_expr"),
+    (ApplicationExpr, "visit_application_expr"),
+    (CaseExpr, "visit_case_expr"),
+    (DottedIdentifierExpr, "visit_dotted_identifier_expr"),
+    (GroupingExpr, "visit_grouping_expr"),
+    (IdentifierExpr, "visit_identifier_expr"),
+    (IfExpr, "visit_if_expr"),
+    (InfixExpr, "visit_infix_expr"),
+    (ListExpr, "visit_list_expr"),
+    (EmptyListExpr, "visit_list_expr"),
+    (SingletonListExpr, "visit_list_expr"),
+    (PairListExpr, "visit_list_expr"),
+    (LiteralExpr, "visit_literal_expr"),
+    (MatchExpr, "visit_match_expr"),
+    (PrefixExpr, "visit_prefix_expr"),
+    (RelationExpr, "visit_relation_expr"),
+    (TupleExpr, "visit_tuple_expr"),
+    (EmptyTupleExpr, "visit_tuple_expr"),
+    (SingletonTupleExpr, "visit_tuple_expr"),
+    (PairTupleExpr, "visit_tuple_expr"),
+):
+    _namespace: dict[str, typing.Any] = {}
+
+    exec(  # noqa: S102
+        f"def accept(self, visitor):\n"
+        f"    return visitor.{_visit_name}(self)",
+        _namespace,
+    )
+
+    _namespace["accept"].__qualname__ = f"{_class.__name__}.accept"
+    _class.accept = _namespace["accept"]
+
+del _class, _visit_name, _namespace
+
+
+# Module-level mirrors of the `NODE_KIND` class constants, so hot
+# dispatch sites can write `if node.NODE_KIND == K_APPLICATION_EXPR:`
+# without an attribute load on the class. The size-specialized list and
+# tuple literal classes share `K_LIST_EXPR`/`K_TUPLE_EXPR`.
+K_ANNOTATED_EXPR: typing.Final = 0
+K_APPLICATION_EXPR: typing.Final = 1
+K_CASE_EXPR: typing.Final = 2
+K_DOTTED_IDENTIFIER_EXPR: typing.Final = 3
+K_GROUPING_EXPR: typing.Final = 4
+K_IDENTIFIER_EXPR: typing.Final = 5
+K_IF_EXPR: typing.Final = 6
+K_INFIX_EXPR: typing.Final = 7
+K_LIST_EXPR: typing.Final = 8
+K_LITERAL_EXPR: typing.Final = 9
+K_MATCH_EXPR: typing.Final = 10
+K_PREFIX_EXPR: typing.Final = 11
+K_RELATION_EXPR: typing.Final = 12
+K_TUPLE_EXPR: typing.Final = 13
 
 
 type Expr = (
@@ -374,6 +793,8 @@ type Expr = (
     | ApplicationExpr
     | CaseExpr
     | DottedIdentifierExpr
+    | EmptyListExpr
+    | EmptyTupleExpr
     | GroupingExpr
     | IdentifierExpr
     | IfExpr
@@ -381,7 +802,90 @@ type Expr = (
     | ListExpr
     | LiteralExpr
     | MatchExpr
+    | PairListExpr
+    | PairTupleExpr
     | PrefixExpr
     | RelationExpr
+    | SingletonListExpr
+    | SingletonTupleExpr
     | TupleExpr
 )
+
+
+# Frozen set of every concrete expression class, mirroring the `Expr`
+# alias. `type(node) in EXPR_TYPES` is a single hash lookup, whereas
+# `isinstance(node, Expr)` scans the union's tuple of members.
+EXPR_TYPES: typing.Final[frozenset[type]] = frozenset((
+    AnnotatedExpr,
+    ApplicationExpr,
+    CaseExpr,
+    DottedIdentifierExpr,
+    EmptyListExpr,
+    EmptyTupleExpr,
+    GroupingExpr,
+    IdentifierExpr,
+    IfExpr,
+    InfixExpr,
+    ListExpr,
+    LiteralExpr,
+    MatchExpr,
+    PairListExpr,
+    PairTupleExpr,
+    PrefixExpr,
+    RelationExpr,
+    SingletonListExpr,
+    SingletonTupleExpr,
+    TupleExpr,
+))
+
+
+def make_list_expr(
+    span: tuple[int, int],
+    items: tuple[Expr, ...],
+    *,
+    type_id: int = -1,
+) -> EmptyListExpr | SingletonListExpr | PairListExpr | ListExpr:
+    """
+    Build a list literal node, picking the size-specialized class when
+    the literal holds at most two items.
+
+    Returns
+    -------
+    The list literal node.
+    """
+
+    match items:
+        case ():
+            return EmptyListExpr(span, type_id=type_id)
+        case (item0,):
+            return SingletonListExpr(span, item0, type_id=type_id)
+        case (item0, item1):
+            return PairListExpr(span, item0, item1, type_id=type_id)
+        case _:
+            return ListExpr(span, items, type_id=type_id)
+
+
+def make_tuple_expr(
+    span: tuple[int, int],
+    items: tuple[Expr, ...],
+    *,
+    type_id: int = -1,
+) -> EmptyTupleExpr | SingletonTupleExpr | PairTupleExpr | TupleExpr:
+    """
+    Build a tuple literal node, picking the size-specialized class when
+    the literal holds at most two items.
+
+    Returns
+    -------
+    The tuple literal node.
+    """
+
+    match items:
+        case ():
+            return EmptyTupleExpr(span, type_id=type_id)
+        case (item0,):
+            return SingletonTupleExpr(span, item0, type_id=type_id)
+        case (item0, item1):
+            return PairTupleExpr(span, item0, item1, type_id=type_id)
+        case _:
+            return TupleExpr(span, items, type_id=type_id)
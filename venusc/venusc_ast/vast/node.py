@@ -24,7 +24,7 @@ class Topnode:
     Represents the top node of an AST.
     """
 
-    statements: list[Stmt]
+    statements: tuple[Stmt, ...]
 
 
 type AstNode = Expr | Stmt
@@ -0,0 +1,313 @@
+"""
+Compact binary serialization for the columnar AST stores.
+
+`dump` flattens an `ExprStore`/`StmtStore` pair into one `bytes` object
+(one column after another, each length-prefixed) and `load` rebuilds the
+stores with one bulk read per column. Together with `source_digest` this
+lets a driver cache parse results on disk keyed by the source hash and
+skip lexing and parsing entirely when a file has not changed.
+
+Numeric columns are written in native byte order; cache files are
+machine-local and must not be shared across architectures. Type columns
+are not serialized — stores are expected to be dumped right after
+parsing, before type resolution — and come back filled with `None`.
+"""
+
+from __future__ import annotations
+
+import array
+import hashlib
+import struct
+import typing
+
+from tokens import CATEGORY
+from tokens import Token
+from tokens import TokenKind
+
+from vast.store import ExprStore
+from vast.store import StmtStore
+
+if typing.TYPE_CHECKING:
+    import tokens
+
+_MAGIC: typing.Final = b"VAST"
+_VERSION: typing.Final = 1
+
+# Kind members keyed by the identity of their category payload, so the
+# `Operator`/`Relation` objects stored in the operator columns can be
+# written as their stable member names.
+_KIND_NAME_BY_CATEGORY: typing.Final = {
+    id(category): kind.name for kind, category in CATEGORY.items()
+}
+
+# (attribute name, codec) for every payload column, in a fixed order
+# shared by `dump` and `load`.
+_EXPR_COLUMNS: typing.Final = (
+    ("annotated_exprs", "ref"),
+    ("annotated_annotations", "ref"),
+    ("application_callees", "ref"),
+    ("application_arguments", "ref_tuple"),
+    ("case_patterns", "ref"),
+    ("case_branches", "ref"),
+    ("dotted_paths", "str_tuple"),
+    ("dotted_tokens", "token_tuple"),
+    ("grouping_grouped", "ref"),
+    ("identifier_tokens", "token"),
+    ("if_conditions", "ref"),
+    ("if_then_branches", "ref"),
+    ("if_else_branches", "ref"),
+    ("infix_operators", "kind"),
+    ("infix_lefts", "ref"),
+    ("infix_rights", "ref"),
+    ("list_items", "ref_tuple"),
+    ("literal_tokens", "token"),
+    ("match_matched", "ref"),
+    ("match_cases", "ref_tuple"),
+    ("prefix_operators", "kind"),
+    ("prefix_rights", "ref"),
+    ("relation_operators", "kind"),
+    ("relation_lefts", "ref"),
+    ("relation_rights", "ref"),
+    ("tuple_items", "ref_tuple"),
+)
+
+_STMT_COLUMNS: typing.Final = (
+    ("fix_targets", "ref"),
+    ("fix_parameters", "ref_tuple"),
+    ("fix_definitions", "ref"),
+    ("fix_constraints", "ref_tuple"),
+    ("let_targets", "ref"),
+    ("let_definitions", "ref"),
+    ("use_sources", "ref"),
+)
+
+
+def source_digest(source: str) -> str:
+    """
+    Hash `source` for use as an AST cache key.
+
+    Returns
+    -------
+    The blake2b hex digest of the UTF-8 encoded source.
+    """
+
+    return hashlib.blake2b(source.encode("utf-8")).hexdigest()
+
+
+class _Writer:
+    """
+    Accumulates length-prefixed chunks; `finish` joins them into one
+    `bytes` object so the caller can issue a single `write()`.
+    """
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def u64(self, value: int) -> None:
+        self._chunks.append(struct.pack("=Q", value))
+
+    def blob(self, data: bytes) -> None:
+        self._chunks.append(struct.pack("=Q", len(data)))
+        self._chunks.append(data)
+
+    def string(self, text: str) -> None:
+        self.blob(text.encode("utf-8"))
+
+    def refs(self, values: list[int]) -> None:
+        self.blob(array.array("Q", values).tobytes())
+
+    def token(self, token: tokens.Token) -> None:
+        self.string(token.kind.name)
+        self.u64(token.start)
+        self.u64(token.end)
+
+    def finish(self) -> bytes:
+        return b"".join(self._chunks)
+
+
+class _Reader:
+    """
+    Cursor over a `dump` payload, mirroring `_Writer`.
+    """
+
+    __slots__ = ("_data", "_offset", "_source")
+
+    def __init__(self, data: bytes, source: bytes) -> None:
+        self._data = data
+        self._offset = 0
+        self._source = source
+
+    def u64(self) -> int:
+        (value,) = struct.unpack_from("=Q", self._data, self._offset)
+        self._offset += 8
+
+        return value
+
+    def blob(self) -> bytes:
+        length = self.u64()
+        data = self._data[self._offset : self._offset + length]
+        self._offset += length
+
+        return data
+
+    def string(self) -> str:
+        return self.blob().decode("utf-8")
+
+    def refs(self) -> list[int]:
+        values = array.array("Q")
+        values.frombytes(self.blob())
+
+        return values.tolist()
+
+    def token(self) -> tokens.Token:
+        kind = TokenKind[self.string()]
+        start = self.u64()
+        end = self.u64()
+
+        return Token(kind, start, end, self._source)
+
+
+def _write_column(  # noqa: C901, PLR0912
+    writer: _Writer,
+    column: list[typing.Any],
+    codec: str,
+) -> None:
+    match codec:
+        case "ref":
+            writer.refs(column)
+        case "ref_tuple":
+            writer.u64(len(column))
+
+            for refs in column:
+                writer.refs(list(refs))
+        case "str_tuple":
+            writer.u64(len(column))
+
+            for strings in column:
+                writer.u64(len(strings))
+
+                for string in strings:
+                    writer.string(string)
+        case "token":
+            writer.u64(len(column))
+
+            for token in column:
+                writer.token(token)
+        case "token_tuple":
+            writer.u64(len(column))
+
+            for token_group in column:
+                writer.u64(len(token_group))
+
+                for token in token_group:
+                    writer.token(token)
+        case "kind":
+            writer.u64(len(column))
+
+            for category in column:
+                writer.string(_KIND_NAME_BY_CATEGORY[id(category)])
+        case _:
+            raise ValueError(codec)
+
+
+def _read_column(reader: _Reader, codec: str) -> list[typing.Any]:
+    match codec:
+        case "ref":
+            return reader.refs()
+        case "ref_tuple":
+            return [tuple(reader.refs()) for _ in range(reader.u64())]
+        case "str_tuple":
+            return [
+                tuple(reader.string() for _ in range(reader.u64()))
+                for _ in range(reader.u64())
+            ]
+        case "token":
+            return [reader.token() for _ in range(reader.u64())]
+        case "token_tuple":
+            return [
+                tuple(reader.token() for _ in range(reader.u64()))
+                for _ in range(reader.u64())
+            ]
+        case "kind":
+            return [
+                CATEGORY[TokenKind[reader.string()]]
+                for _ in range(reader.u64())
+            ]
+        case _:
+            raise ValueError(codec)
+
+
+def dump(expr_store: ExprStore, stmt_store: StmtStore) -> bytes:
+    """
+    Serialize the stores into one contiguous payload.
+
+    Returns
+    -------
+    bytes
+    """
+
+    writer = _Writer()
+    writer.blob(_MAGIC)
+    writer.u64(_VERSION)
+
+    for table in expr_store.spans:
+        writer.blob(table._packed.tobytes())  # noqa: SLF001
+
+    for name, codec in _EXPR_COLUMNS:
+        _write_column(writer, getattr(expr_store, name), codec)
+
+    for table in stmt_store.spans:
+        writer.blob(table._packed.tobytes())  # noqa: SLF001
+
+    for name, codec in _STMT_COLUMNS:
+        _write_column(writer, getattr(stmt_store, name), codec)
+
+    return writer.finish()
+
+
+def load(data: bytes, source: str = "") -> tuple[ExprStore, StmtStore]:
+    """
+    Rebuild the stores from a `dump` payload.
+
+    Tokens are stored as spans; `source` must be the text the payload
+    was built from (the caller has it at hand, since the cache is keyed
+    by its digest) so the rebuilt tokens can slice their lexemes.
+
+    Returns
+    -------
+    (ExprStore, StmtStore)
+
+    Raises
+    ------
+    ValueError
+        If the payload does not carry the expected magic and version.
+    """
+
+    reader = _Reader(data, source.encode("utf-8"))
+
+    if reader.blob() != _MAGIC or reader.u64() != _VERSION:
+        message = "not a serialized AST store payload"
+
+        raise ValueError(message)
+
+    expr_store = ExprStore()
+
+    for table in expr_store.spans:
+        table._packed.frombytes(reader.blob())  # noqa: SLF001
+
+    expr_store.types = [[None] * len(table) for table in expr_store.spans]
+
+    for name, codec in _EXPR_COLUMNS:
+        setattr(expr_store, name, _read_column(reader, codec))
+
+    stmt_store = StmtStore()
+
+    for table in stmt_store.spans:
+        table._packed.frombytes(reader.blob())  # noqa: SLF001
+
+    for name, codec in _STMT_COLUMNS:
+        setattr(stmt_store, name, _read_column(reader, codec))
+
+    return (expr_store, stmt_store)
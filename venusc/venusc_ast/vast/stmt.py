@@ -4,18 +4,15 @@ Venus statement tree
 
 from __future__ import annotations
 
-import abc
 import typing
 
-import attrs
-
 if typing.TYPE_CHECKING:
     from .expr import DottedIdentifierExpr
     from .expr import Expr
     from .expr import IdentifierExpr
 
 
-class StmtVisitor[R_co](typing.Protocol):
+class StmtVisitor[R_co]:
     """
     Interface for visiting the statement tree.
     """
@@ -24,37 +21,41 @@ class StmtVisitor[R_co](typing.Protocol):
         """
         Visit a fix definition stmt.
         """
-        ...
+        raise NotImplementedError
 
     def visit_let_stmt(self, stmt: LetStmt) -> R_co:
         """
         Visit a let assignment stmt.
         """
-        ...
+        raise NotImplementedError
 
     def visit_use_stmt(self, stmt: UseStmt) -> R_co:
         """
         Visit a use import stmt.
         """
-        ...
+        raise NotImplementedError
 
 
-@attrs.frozen
-class AbstractStmt(abc.ABC):
+class AbstractStmt:
     """
     Represents an abstract statement node.
     """
 
+    __slots__ = ("__weakref__", "span")
+
     span: tuple[int, int]
 
-    @abc.abstractmethod
+    def __init__(self, span: tuple[int, int]) -> None:
+        self.span = span
+
     def accept[R](self, visitor: StmtVisitor[R]) -> R:
         """
         Accept a statement visitor.
         """
 
+        raise NotImplementedError
+
 
-@attrs.frozen
 class FixStmt(AbstractStmt):
     """
     Represents a fix definition statement.
@@ -66,17 +67,30 @@ class FixStmt(AbstractStmt):
     ```
     """
 
+    __slots__ = ("constraints", "definition", "parameters", "target")
+
+    NODE_KIND: typing.ClassVar[int] = 14
+
     target: IdentifierExpr
-    parameters: list[IdentifierExpr]  # TODO: allow more types
+    parameters: tuple[IdentifierExpr, ...]  # TODO: allow more types
     definition: Expr
-    constraints: list[Expr]
-
-    @typing.override
-    def accept[R](self, visitor: StmtVisitor[R]) -> R:
-        return visitor.visit_fix_stmt(self)
+    constraints: tuple[Expr, ...]
+
+    def __init__(
+        self,
+        span: tuple[int, int],
+        target: IdentifierExpr,
+        parameters: tuple[IdentifierExpr, ...],
+        definition: Expr,
+        constraints: tuple[Expr, ...],
+    ) -> None:
+        super().__init__(span)
+        self.target = target
+        self.parameters = parameters
+        self.definition = definition
+        self.constraints = constraints
 
 
-@attrs.frozen
 class LetStmt(AbstractStmt):
     """
     Represents a let assignment statement.
@@ -86,15 +100,24 @@ class LetStmt(AbstractStmt):
     ```
     """
 
+    __slots__ = ("definition", "target")
+
+    NODE_KIND: typing.ClassVar[int] = 15
+
     target: IdentifierExpr  # TODO: allow more types
     definition: Expr
 
-    @typing.override
-    def accept[R](self, visitor: StmtVisitor[R]) -> R:
-        return visitor.visit_let_stmt(self)
+    def __init__(
+        self,
+        span: tuple[int, int],
+        target: IdentifierExpr,
+        definition: Expr,
+    ) -> None:
+        super().__init__(span)
+        self.target = target
+        self.definition = definition
 
 
-@attrs.frozen
 class UseStmt(AbstractStmt):
     """
     Represents a use import statement.
@@ -104,11 +127,57 @@ class UseStmt(AbstractStmt):
     ```
     """
 
+    __slots__ = ("source",)
+
+    NODE_KIND: typing.ClassVar[int] = 16
+
     source: DottedIdentifierExpr
 
-    @typing.override
-    def accept[R](self, visitor: StmtVisitor[R]) -> R:
-        return visitor.visit_use_stmt(self)
+    def __init__(
+        self,
+        span: tuple[int, int],
+        source: DottedIdentifierExpr,
+    ) -> None:
+        super().__init__(span)
+        self.source = source
+
+
+# `accept` is textually identical across the concrete classes modulo
+# the visit method name; compile it once per class, as in `expr.py`.
+for _class, _visit_name in (
+    (FixStmt, "visit_fix_stmt"),
+    (LetStmt, "visit_let_stmt"),
+    (UseStmt, "visit_use_stmt"),
+):
+    _namespace: dict[str, typing.Any] = {}
+
+    exec(  # noqa: S102
+        f"def accept(self, visitor):\n"
+        f"    return visitor.{_visit_name}(self)",
+        _namespace,
+    )
+
+    _namespace["accept"].__qualname__ = f"{_class.__name__}.accept"
+    _class.accept = _namespace["accept"]
+
+del _class, _visit_name, _namespace
+
+
+# Module-level mirrors of the `NODE_KIND` class constants; statement
+# kinds continue the expression numbering so combined visitors can use
+# one dense table.
+K_FIX_STMT: typing.Final = 14
+K_LET_STMT: typing.Final = 15
+K_USE_STMT: typing.Final = 16
 
 
 type Stmt = FixStmt | LetStmt | UseStmt
+
+
+# Frozen set of every concrete statement class, mirroring the `Stmt`
+# alias; `type(node) in STMT_TYPES` is a single hash lookup.
+STMT_TYPES: typing.Final[frozenset[type]] = frozenset((
+    FixStmt,
+    LetStmt,
+    UseStmt,
+))
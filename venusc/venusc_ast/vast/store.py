@@ -0,0 +1,607 @@
+"""
+Columnar (struct-of-arrays) storage for the Venus AST.
+
+The object tree in `expr.py`/`stmt.py` stores one heap object per node.
+Passes that only read spans (error reporting) or only types (type
+checking) still pull whole node objects into cache. The stores below
+keep one column per field instead, grouped by node kind, and reference
+nodes through packed integer refs. A ref carries the node kind in its
+high bits and the index into the kind's columns in its low bits.
+"""
+
+from __future__ import annotations
+
+import array
+import typing
+
+from vast.expr import AnnotatedExpr
+from vast.expr import ApplicationExpr
+from vast.expr import CaseExpr
+from vast.expr import DottedIdentifierExpr
+from vast.expr import GroupingExpr
+from vast.expr import IdentifierExpr
+from vast.expr import IfExpr
+from vast.expr import InfixExpr
+from vast.expr import ListExpr
+from vast.expr import LiteralExpr
+from vast.expr import MatchExpr
+from vast.expr import PrefixExpr
+from vast.expr import RelationExpr
+from vast.expr import TupleExpr
+from vast.stmt import FixStmt
+from vast.stmt import LetStmt
+from vast.stmt import UseStmt
+
+if typing.TYPE_CHECKING:
+    import tokens
+    import type  # noqa: A004
+
+type ExprRef = int
+type StmtRef = int
+type NodeRef = int
+
+INDEX_BITS: typing.Final = 28
+_INDEX_MASK: typing.Final = (1 << INDEX_BITS) - 1
+
+
+def make_ref(kind: int, index: int) -> NodeRef:
+    """
+    Pack a node kind and a column index into a single ref.
+
+    Returns
+    -------
+    NodeRef
+    """
+
+    return (kind << INDEX_BITS) | index
+
+
+def ref_kind(ref: NodeRef) -> int:
+    """
+    Extract the `NODE_KIND` tag of a ref.
+
+    Returns
+    -------
+    int
+    """
+
+    return ref >> INDEX_BITS
+
+
+def ref_index(ref: NodeRef) -> int:
+    """
+    Extract the column index of a ref.
+
+    Returns
+    -------
+    int
+    """
+
+    return ref & _INDEX_MASK
+
+
+class SpanTable:
+    """
+    Shared table of interned spans.
+
+    A span is stored as `(start << 32) | end` in a contiguous array of
+    unsigned 64-bit integers; owners keep only the table index. This
+    costs 8 bytes per span instead of a tuple holding two boxed ints.
+    """
+
+    __slots__ = ("_packed",)
+
+    def __init__(self) -> None:
+        self._packed = array.array("Q")
+
+    def __len__(self) -> int:
+        return len(self._packed)
+
+    def append(self, start: int, end: int) -> int:
+        """
+        Intern the span `(start, end)`.
+
+        Returns
+        -------
+        The index of the span in the table.
+        """
+
+        index = len(self._packed)
+        self._packed.append((start << 32) | end)
+
+        return index
+
+    def get(self, index: int) -> tuple[int, int]:
+        """
+        Unpack the span stored at `index`.
+
+        Returns
+        -------
+        (int, int)
+        """
+
+        packed = self._packed[index]
+
+        return (packed >> 32, packed & 0xFFFFFFFF)
+
+
+class ExprStore:
+    """
+    Struct-of-arrays storage for expression nodes.
+
+    Each node kind owns one span column, one type column and one column
+    per payload field; a node is the set of entries sharing an index.
+    """
+
+    _EXPR_KIND_COUNT: typing.Final = 14
+
+    def __init__(self) -> None:
+        self.spans: list[SpanTable] = [
+            SpanTable() for _ in range(self._EXPR_KIND_COUNT)
+        ]
+        self.types: list[list[type.Type | None]] = [
+            [] for _ in range(self._EXPR_KIND_COUNT)
+        ]
+
+        self.annotated_exprs: list[ExprRef] = []
+        self.annotated_annotations: list[ExprRef] = []
+
+        self.application_callees: list[ExprRef] = []
+        self.application_arguments: list[tuple[ExprRef, ...]] = []
+
+        self.case_patterns: list[ExprRef] = []
+        self.case_branches: list[ExprRef] = []
+
+        self.dotted_paths: list[tuple[str, ...]] = []
+        self.dotted_tokens: list[tuple[tokens.Token, ...]] = []
+
+        self.grouping_grouped: list[ExprRef] = []
+
+        self.identifier_tokens: list[tokens.Token] = []
+
+        self.if_conditions: list[ExprRef] = []
+        self.if_then_branches: list[ExprRef] = []
+        self.if_else_branches: list[ExprRef] = []
+
+        self.infix_operators: list[tokens.Operator] = []
+        self.infix_lefts: list[ExprRef] = []
+        self.infix_rights: list[ExprRef] = []
+
+        self.list_items: list[tuple[ExprRef, ...]] = []
+
+        self.literal_tokens: list[tokens.Token] = []
+
+        self.match_matched: list[ExprRef] = []
+        self.match_cases: list[tuple[ExprRef, ...]] = []
+
+        self.prefix_operators: list[tokens.Operator] = []
+        self.prefix_rights: list[ExprRef] = []
+
+        self.relation_operators: list[tokens.Relation] = []
+        self.relation_lefts: list[ExprRef] = []
+        self.relation_rights: list[ExprRef] = []
+
+        self.tuple_items: list[tuple[ExprRef, ...]] = []
+
+    def _new_node(self, kind: int, span: tuple[int, int]) -> ExprRef:
+        index = self.spans[kind].append(span[0], span[1])
+        self.types[kind].append(None)
+
+        return make_ref(kind, index)
+
+    def span_of(self, ref: ExprRef) -> tuple[int, int]:
+        """
+        Return the span of the node referenced by `ref`.
+
+        Returns
+        -------
+        (int, int)
+        """
+
+        return self.spans[ref >> INDEX_BITS].get(ref & _INDEX_MASK)
+
+    def type_of(self, ref: ExprRef) -> type.Type | None:
+        """
+        Return the type of the node referenced by `ref`, if resolved.
+
+        Returns
+        -------
+        Type or None
+        """
+
+        return self.types[ref >> INDEX_BITS][ref & _INDEX_MASK]
+
+    def set_type(self, ref: ExprRef, typ: type.Type) -> None:
+        """
+        Record the resolved type of the node referenced by `ref`.
+        """
+
+        self.types[ref >> INDEX_BITS][ref & _INDEX_MASK] = typ
+
+    # *- Node makers -* #
+
+    def make_annotated(
+        self,
+        span: tuple[int, int],
+        expr: ExprRef,
+        annotation: ExprRef,
+    ) -> ExprRef:
+        """
+        Append a type-annotated expression node.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(AnnotatedExpr.NODE_KIND, span)
+        self.annotated_exprs.append(expr)
+        self.annotated_annotations.append(annotation)
+
+        return ref
+
+    def make_application(
+        self,
+        span: tuple[int, int],
+        application: ExprRef,
+        arguments: tuple[ExprRef, ...],
+    ) -> ExprRef:
+        """
+        Append an application (function call) expression node.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(ApplicationExpr.NODE_KIND, span)
+        self.application_callees.append(application)
+        self.application_arguments.append(arguments)
+
+        return ref
+
+    def make_case(
+        self,
+        span: tuple[int, int],
+        pattern: ExprRef,
+        branch: ExprRef,
+    ) -> ExprRef:
+        """
+        Append a case node of a match expression.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(CaseExpr.NODE_KIND, span)
+        self.case_patterns.append(pattern)
+        self.case_branches.append(branch)
+
+        return ref
+
+    def make_dotted_identifier(
+        self,
+        span: tuple[int, int],
+        path: tuple[str, ...],
+        tokens: tuple[tokens.Token, ...],
+    ) -> ExprRef:
+        """
+        Append a dotted identifier expression node.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(DottedIdentifierExpr.NODE_KIND, span)
+        self.dotted_paths.append(path)
+        self.dotted_tokens.append(tokens)
+
+        return ref
+
+    def make_grouping(
+        self,
+        span: tuple[int, int],
+        grouped: ExprRef,
+    ) -> ExprRef:
+        """
+        Append a parenthesized expression node.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(GroupingExpr.NODE_KIND, span)
+        self.grouping_grouped.append(grouped)
+
+        return ref
+
+    def make_identifier(
+        self,
+        span: tuple[int, int],
+        token: tokens.Token,
+    ) -> ExprRef:
+        """
+        Append an identifier expression node.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(IdentifierExpr.NODE_KIND, span)
+        self.identifier_tokens.append(token)
+
+        return ref
+
+    def make_if(
+        self,
+        span: tuple[int, int],
+        condition: ExprRef,
+        then_branch: ExprRef,
+        else_branch: ExprRef,
+    ) -> ExprRef:
+        """
+        Append an if-then-else expression node.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(IfExpr.NODE_KIND, span)
+        self.if_conditions.append(condition)
+        self.if_then_branches.append(then_branch)
+        self.if_else_branches.append(else_branch)
+
+        return ref
+
+    def make_infix(
+        self,
+        span: tuple[int, int],
+        operator: tokens.Operator,
+        left: ExprRef,
+        right: ExprRef,
+    ) -> ExprRef:
+        """
+        Append an infix (operator) expression node.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(InfixExpr.NODE_KIND, span)
+        self.infix_operators.append(operator)
+        self.infix_lefts.append(left)
+        self.infix_rights.append(right)
+
+        return ref
+
+    def make_list(
+        self,
+        span: tuple[int, int],
+        items: tuple[ExprRef, ...],
+    ) -> ExprRef:
+        """
+        Append a list literal expression node.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(ListExpr.NODE_KIND, span)
+        self.list_items.append(items)
+
+        return ref
+
+    def make_literal(
+        self,
+        span: tuple[int, int],
+        token: tokens.Token,
+    ) -> ExprRef:
+        """
+        Append an atomic literal expression node.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(LiteralExpr.NODE_KIND, span)
+        self.literal_tokens.append(token)
+
+        return ref
+
+    def make_match(
+        self,
+        span: tuple[int, int],
+        matched: ExprRef,
+        cases: tuple[ExprRef, ...],
+    ) -> ExprRef:
+        """
+        Append a match-case-end expression node.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(MatchExpr.NODE_KIND, span)
+        self.match_matched.append(matched)
+        self.match_cases.append(cases)
+
+        return ref
+
+    def make_prefix(
+        self,
+        span: tuple[int, int],
+        operator: tokens.Operator,
+        right: ExprRef,
+    ) -> ExprRef:
+        """
+        Append a prefix (operator) expression node.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(PrefixExpr.NODE_KIND, span)
+        self.prefix_operators.append(operator)
+        self.prefix_rights.append(right)
+
+        return ref
+
+    def make_relation(
+        self,
+        span: tuple[int, int],
+        operator: tokens.Relation,
+        left: ExprRef,
+        right: ExprRef,
+    ) -> ExprRef:
+        """
+        Append a relation expression node.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(RelationExpr.NODE_KIND, span)
+        self.relation_operators.append(operator)
+        self.relation_lefts.append(left)
+        self.relation_rights.append(right)
+
+        return ref
+
+    def make_tuple(
+        self,
+        span: tuple[int, int],
+        items: tuple[ExprRef, ...],
+    ) -> ExprRef:
+        """
+        Append a tuple literal expression node.
+
+        Returns
+        -------
+        ExprRef
+        """
+
+        ref = self._new_node(TupleExpr.NODE_KIND, span)
+        self.tuple_items.append(items)
+
+        return ref
+
+
+class StmtStore:
+    """
+    Struct-of-arrays storage for statement nodes.
+
+    Statement kinds keep their global `NODE_KIND` numbering in refs; the
+    columns are indexed by the kind offset within this store.
+    """
+
+    _FIRST_STMT_KIND: typing.Final = FixStmt.NODE_KIND
+    _STMT_KIND_COUNT: typing.Final = 3
+
+    def __init__(self) -> None:
+        self.spans: list[SpanTable] = [
+            SpanTable() for _ in range(self._STMT_KIND_COUNT)
+        ]
+
+        self.fix_targets: list[ExprRef] = []
+        self.fix_parameters: list[tuple[ExprRef, ...]] = []
+        self.fix_definitions: list[ExprRef] = []
+        self.fix_constraints: list[tuple[ExprRef, ...]] = []
+
+        self.let_targets: list[ExprRef] = []
+        self.let_definitions: list[ExprRef] = []
+
+        self.use_sources: list[ExprRef] = []
+
+    def _new_node(self, kind: int, span: tuple[int, int]) -> StmtRef:
+        table = self.spans[kind - self._FIRST_STMT_KIND]
+        index = table.append(span[0], span[1])
+
+        return make_ref(kind, index)
+
+    def span_of(self, ref: StmtRef) -> tuple[int, int]:
+        """
+        Return the span of the statement referenced by `ref`.
+
+        Returns
+        -------
+        (int, int)
+        """
+
+        kind = ref >> INDEX_BITS
+
+        return self.spans[kind - self._FIRST_STMT_KIND].get(
+            ref & _INDEX_MASK,
+        )
+
+    def make_fix(
+        self,
+        span: tuple[int, int],
+        target: ExprRef,
+        parameters: tuple[ExprRef, ...],
+        definition: ExprRef,
+        constraints: tuple[ExprRef, ...],
+    ) -> StmtRef:
+        """
+        Append a fix definition statement node.
+
+        Returns
+        -------
+        StmtRef
+        """
+
+        ref = self._new_node(FixStmt.NODE_KIND, span)
+        self.fix_targets.append(target)
+        self.fix_parameters.append(parameters)
+        self.fix_definitions.append(definition)
+        self.fix_constraints.append(constraints)
+
+        return ref
+
+    def make_let(
+        self,
+        span: tuple[int, int],
+        target: ExprRef,
+        definition: ExprRef,
+    ) -> StmtRef:
+        """
+        Append a let assignment statement node.
+
+        Returns
+        -------
+        StmtRef
+        """
+
+        ref = self._new_node(LetStmt.NODE_KIND, span)
+        self.let_targets.append(target)
+        self.let_definitions.append(definition)
+
+        return ref
+
+    def make_use(
+        self,
+        span: tuple[int, int],
+        source: ExprRef,
+    ) -> StmtRef:
+        """
+        Append a use import statement node.
+
+        Returns
+        -------
+        StmtRef
+        """
+
+        ref = self._new_node(UseStmt.NODE_KIND, span)
+        self.use_sources.append(source)
+
+        return ref
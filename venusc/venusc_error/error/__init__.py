@@ -5,17 +5,16 @@ Definition of Venus' compiler error tree.
 
 from __future__ import annotations
 
-import abc
 import typing
 
-import attrs
-
+# The `_make_error` field annotations below are strings that name
+# these modules; type checkers resolve them through the imports.
 if typing.TYPE_CHECKING:
-    import tokens
-    import vast
+    import tokens  # noqa: F401
+    import vast  # noqa: F401
 
 
-class SyntaxErrorVisitor[R_co](typing.Protocol):
+class SyntaxErrorVisitor[R_co]:
     """
     Represents a visitor of the syntax error tree.
     """
@@ -27,7 +26,7 @@ class SyntaxErrorVisitor[R_co](typing.Protocol):
         """
         Visit an invalid string escape sequence error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_unclosed_string_error(
         self,
@@ -36,7 +35,7 @@ class SyntaxErrorVisitor[R_co](typing.Protocol):
         """
         Visit an unclosed string error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_unexpected_special_character_in_string_error(
         self,
@@ -45,7 +44,7 @@ class SyntaxErrorVisitor[R_co](typing.Protocol):
         """
         Visit an unexpected special character in string error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_unrecognized_character_error(
         self,
@@ -54,10 +53,10 @@ class SyntaxErrorVisitor[R_co](typing.Protocol):
         """
         Visit an unrecognized character error.
         """
-        ...
+        raise NotImplementedError
 
 
-class GrammarErrorVisitor[R_co](typing.Protocol):
+class GrammarErrorVisitor[R_co]:
     """
     Represents a visitor of the grammar error tree.
     """
@@ -69,7 +68,7 @@ class GrammarErrorVisitor[R_co](typing.Protocol):
         """
         Visit an incomplete expression error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_incorrect_keyword_kind_error(
         self,
@@ -78,7 +77,7 @@ class GrammarErrorVisitor[R_co](typing.Protocol):
         """
         Visit an incorrect keyword kind error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_keyword_misuse_error(
         self,
@@ -87,7 +86,7 @@ class GrammarErrorVisitor[R_co](typing.Protocol):
         """
         Visit a keyword misuse error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_mismatched_tokens_error(
         self,
@@ -96,7 +95,7 @@ class GrammarErrorVisitor[R_co](typing.Protocol):
         """
         Visit a mismatched tokens error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_unexpected_eof_error(
         self,
@@ -105,7 +104,7 @@ class GrammarErrorVisitor[R_co](typing.Protocol):
         """
         Visit an unexpected EOF error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_unexpected_first_class_expression_error(
         self,
@@ -114,7 +113,7 @@ class GrammarErrorVisitor[R_co](typing.Protocol):
         """
         Visit an unexpected first class expression error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_unexpected_token_error(
         self,
@@ -123,7 +122,7 @@ class GrammarErrorVisitor[R_co](typing.Protocol):
         """
         Visit an unexpected token error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_unmatched_bracket_error(
         self,
@@ -132,10 +131,10 @@ class GrammarErrorVisitor[R_co](typing.Protocol):
         """
         Visit an unmatched bracket error.
         """
-        ...
+        raise NotImplementedError
 
 
-class NameAnalysisErrorVisitor[R_co](typing.Protocol):
+class NameAnalysisErrorVisitor[R_co]:
     """
     Represents a visitor of the name analysis error tree.
     """
@@ -147,7 +146,7 @@ class NameAnalysisErrorVisitor[R_co](typing.Protocol):
         """
         Visit an implicitly unused symbol error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_out_of_scope_symbol_error(
         self,
@@ -156,7 +155,7 @@ class NameAnalysisErrorVisitor[R_co](typing.Protocol):
         """
         Visit an out of scope symbol error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_undefined_symbol_error(
         self,
@@ -165,7 +164,7 @@ class NameAnalysisErrorVisitor[R_co](typing.Protocol):
         """
         Visit an undefined symbol error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_use_before_definition_error(
         self,
@@ -174,10 +173,10 @@ class NameAnalysisErrorVisitor[R_co](typing.Protocol):
         """
         Visit a use before definition error.
         """
-        ...
+        raise NotImplementedError
 
 
-class TypeCheckingErrorVisitor[R_co](typing.Protocol):
+class TypeCheckingErrorVisitor[R_co]:
     """
     Represents a visitor of the type checking error tree.
     """
@@ -189,7 +188,7 @@ class TypeCheckingErrorVisitor[R_co](typing.Protocol):
         """
         Visit an invalid argument type error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_mismatched_types_error(
         self,
@@ -198,7 +197,7 @@ class TypeCheckingErrorVisitor[R_co](typing.Protocol):
         """
         Visit a mismatched types error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_missing_constraints_error(
         self,
@@ -207,7 +206,7 @@ class TypeCheckingErrorVisitor[R_co](typing.Protocol):
         """
         Visit a missing constraints error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_nonhalting_inductive_definition_error(
         self,
@@ -216,7 +215,7 @@ class TypeCheckingErrorVisitor[R_co](typing.Protocol):
         """
         Visit a nonhalting inductive definition error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_unfixed_inductive_definition_error(
         self,
@@ -225,7 +224,7 @@ class TypeCheckingErrorVisitor[R_co](typing.Protocol):
         """
         Visit an unfixed inductive defintion error.
         """
-        ...
+        raise NotImplementedError
 
     def visit_uninferable_definition_type_error(
         self,
@@ -234,95 +233,358 @@ class TypeCheckingErrorVisitor[R_co](typing.Protocol):
         """
         Visit an uninferable definition error.
         """
-        ...
+        raise NotImplementedError
 
 
-class CompilationErrorVisitor[R_co](
-    TypeCheckingErrorVisitor[R_co],
-    NameAnalysisErrorVisitor[R_co],
-    GrammarErrorVisitor[R_co],
-    SyntaxErrorVisitor[R_co],
-):
+class CompilationErrorVisitor[R_co]:  # noqa: PLR0904
     """
     Represents a visitor of the compilation error tree.
+
+    Flat re-declaration of every visit method of the per-stage visitors
+    above, so implementors inherit from a single class instead of a
+    four-deep protocol chain.
     """
 
+    def visit_invalid_string_escape_sequence_error(
+        self,
+        error: InvalidStringEscapeSequenceError,
+    ) -> R_co:
+        """
+        Visit an invalid string escape sequence error.
+        """
+        raise NotImplementedError
+
+    def visit_unclosed_string_error(
+        self,
+        error: UnclosedStringError,
+    ) -> R_co:
+        """
+        Visit an unclosed string error.
+        """
+        raise NotImplementedError
+
+    def visit_unexpected_special_character_in_string_error(
+        self,
+        error: UnexpectedSpecialCharacterInStringError,
+    ) -> R_co:
+        """
+        Visit an unexpected special character in string error.
+        """
+        raise NotImplementedError
+
+    def visit_unrecognized_character_error(
+        self,
+        error: UnrecognizedCharacterError,
+    ) -> R_co:
+        """
+        Visit an unrecognized character error.
+        """
+        raise NotImplementedError
+
+    def visit_incomplete_expression_error(
+        self,
+        error: IncompleteExpressionError,
+    ) -> R_co:
+        """
+        Visit an incomplete expression error.
+        """
+        raise NotImplementedError
+
+    def visit_incorrect_keyword_kind_error(
+        self,
+        error: IncorrectKeywordKindError,
+    ) -> R_co:
+        """
+        Visit an incorrect keyword kind error.
+        """
+        raise NotImplementedError
+
+    def visit_keyword_misuse_error(
+        self,
+        error: KeywordMisuseError,
+    ) -> R_co:
+        """
+        Visit a keyword misuse error.
+        """
+        raise NotImplementedError
+
+    def visit_mismatched_tokens_error(
+        self,
+        error: MismatchedTokensError,
+    ) -> R_co:
+        """
+        Visit a mismatched tokens error.
+        """
+        raise NotImplementedError
+
+    def visit_unexpected_eof_error(
+        self,
+        error: UnexpectedEofError,
+    ) -> R_co:
+        """
+        Visit an unexpected EOF error.
+        """
+        raise NotImplementedError
+
+    def visit_unexpected_first_class_expression_error(
+        self,
+        error: UnexpectedFirstClassExpressionError,
+    ) -> R_co:
+        """
+        Visit an unexpected first class expression error.
+        """
+        raise NotImplementedError
+
+    def visit_unexpected_token_error(
+        self,
+        error: UnexpectedTokenError,
+    ) -> R_co:
+        """
+        Visit an unexpected token error.
+        """
+        raise NotImplementedError
+
+    def visit_unmatched_bracket_error(
+        self,
+        error: UnmatchedBracketError,
+    ) -> R_co:
+        """
+        Visit an unmatched bracket error.
+        """
+        raise NotImplementedError
+
+    def visit_implicitly_unused_symbol_error(
+        self,
+        error: ImplicitlyUnusedSymbolError,
+    ) -> R_co:
+        """
+        Visit an implicitly unused symbol error.
+        """
+        raise NotImplementedError
+
+    def visit_out_of_scope_symbol_error(
+        self,
+        error: OutOfScopeSymbolError,
+    ) -> R_co:
+        """
+        Visit an out of scope symbol error.
+        """
+        raise NotImplementedError
+
+    def visit_undefined_symbol_error(
+        self,
+        error: UndefinedSymbolError,
+    ) -> R_co:
+        """
+        Visit an undefined symbol error.
+        """
+        raise NotImplementedError
 
-@attrs.frozen
-class AbstractCompilationError(abc.ABC):
+    def visit_use_before_definition_error(
+        self,
+        error: UseBeforeDefinitionError,
+    ) -> R_co:
+        """
+        Visit a use before definition error.
+        """
+        raise NotImplementedError
+
+    def visit_invalid_argument_type_error(
+        self,
+        error: InvalidArgumentTypeError,
+    ) -> R_co:
+        """
+        Visit an invalid argument type error.
+        """
+        raise NotImplementedError
+
+    def visit_mismatched_types_error(
+        self,
+        error: MismatchedTypesError,
+    ) -> R_co:
+        """
+        Visit a mismatched types error.
+        """
+        raise NotImplementedError
+
+    def visit_missing_constraints_error(
+        self,
+        error: MissingConstraintsError,
+    ) -> R_co:
+        """
+        Visit a missing constraints error.
+        """
+        raise NotImplementedError
+
+    def visit_nonhalting_inductive_definition_error(
+        self,
+        error: NonhaltingInductiveDefinitionError,
+    ) -> R_co:
+        """
+        Visit a nonhalting inductive definition error.
+        """
+        raise NotImplementedError
+
+    def visit_unfixed_inductive_definition_error(
+        self,
+        error: UnfixedInductiveDefinitionError,
+    ) -> R_co:
+        """
+        Visit an unfixed inductive defintion error.
+        """
+        raise NotImplementedError
+
+    def visit_uninferable_definition_type_error(
+        self,
+        error: UninferableDefinitionError,
+    ) -> R_co:
+        """
+        Visit an uninferable definition error.
+        """
+        raise NotImplementedError
+
+
+class AbstractCompilationError:
     """
     Represents an abstract compilation error.
     """
 
+    __slots__ = ("__weakref__", "span")
+
     span: tuple[int, int]
 
-    @abc.abstractmethod
+    def __init__(self, span: tuple[int, int]) -> None:
+        self.span = span
+
     def accept[R](self, visitor: CompilationErrorVisitor[R]) -> R:
         """
         Accept a compilation error visitor and return the result.
         """
 
+        raise NotImplementedError
+
 
 class AbstractSyntaxError(AbstractCompilationError):
     """
     Represents an abstract syntax error.
     """
 
-    @abc.abstractmethod
-    @typing.override
-    def accept[R](self, visitor: SyntaxErrorVisitor[R]) -> R:
-        pass
+    __slots__ = ()
 
 
-@attrs.frozen
-class InvalidStringEscapeSequenceError(AbstractSyntaxError):
+class AbstractGrammarError(AbstractCompilationError):
     """
-    Error triggered when an invalid escape sequence is found in a string.
+    Represents an abstract grammar error.
     """
 
-    escape_sequence: str
+    __slots__ = ()
 
-    @typing.override
-    def accept[R](self, visitor: SyntaxErrorVisitor[R]) -> R:
-        return visitor.visit_invalid_string_escape_sequence_error(self)
 
-
-@attrs.frozen
-class UnclosedStringError(AbstractSyntaxError):
+def _make_error(
+    name: str,
+    base: type[AbstractCompilationError],
+    visit_name: str,
+    fields: dict[str, str],
+    docstring: str,
+) -> type:
     """
-    Error triggered when the closing quote of a string could not be found.
+    Build a concrete error class from its description.
+
+    The generated class is slotted, carries the given payload `fields`
+    (mapping name to annotation) on top of the inherited `span`, and its
+    `accept` is compiled from source so it calls the `visit_name`
+    method directly rather than looking it up with `getattr`.
+
+    Returns
+    -------
+    The error class.
     """
 
-    @typing.override
-    def accept[R](self, visitor: SyntaxErrorVisitor[R]) -> R:
-        return visitor.visit_unclosed_string_error(self)
+    field_names = tuple(fields)
 
+    def __init__(  # noqa: N807
+        self: typing.Any,
+        span: tuple[int, int],
+        *values: typing.Any,
+    ) -> None:
+        self.span = span
 
-@attrs.frozen
-class UnexpectedSpecialCharacterInStringError(AbstractSyntaxError):
-    """
-    Error triggered when a raw special character is used in a non-raw string.
-    """
+        for field, value in zip(field_names, values, strict=True):
+            setattr(self, field, value)
+
+    accept_namespace: dict[str, typing.Any] = {}
 
-    special_character: str
+    exec(  # noqa: S102
+        f"def accept(self, visitor):\n"
+        f"    return visitor.{visit_name}(self)",
+        accept_namespace,
+    )
 
-    @typing.override
-    def accept[R](self, visitor: SyntaxErrorVisitor[R]) -> R:
-        return visitor.visit_unexpected_special_character_in_string_error(self)
+    accept = accept_namespace["accept"]
+    accept.__qualname__ = f"{name}.accept"
 
+    def __repr__(self: typing.Any) -> str:  # noqa: N807
+        arguments = ", ".join(
+            f"{field}={getattr(self, field)!r}"
+            for field in ("span", *field_names)
+        )
 
-@attrs.frozen
-class UnrecognizedCharacterError(AbstractSyntaxError):
+        return f"{name}({arguments})"
+
+    return type(
+        name,
+        (base,),
+        {
+            "__slots__": field_names,
+            "__annotations__": dict(fields),
+            "__doc__": docstring,
+            "__init__": __init__,
+            "__repr__": __repr__,
+            "accept": accept,
+        },
+    )
+
+
+InvalidStringEscapeSequenceError = _make_error(
+    "InvalidStringEscapeSequenceError",
+    AbstractSyntaxError,
+    "visit_invalid_string_escape_sequence_error",
+    {"escape_sequence": "str"},
     """
-    Error triggered when a character that does not exist in the language is
-    found in the program.
+    Error triggered when an invalid escape sequence is found in a string.
+    """,
+)
+
+UnclosedStringError = _make_error(
+    "UnclosedStringError",
+    AbstractSyntaxError,
+    "visit_unclosed_string_error",
+    {},
     """
+    Error triggered when the closing quote of a string could not be found.
+    """,
+)
 
-    unrecognized_character: str
+UnexpectedSpecialCharacterInStringError = _make_error(
+    "UnexpectedSpecialCharacterInStringError",
+    AbstractSyntaxError,
+    "visit_unexpected_special_character_in_string_error",
+    {"special_character": "str"},
+    """
+    Error triggered when a raw special character is used in a non-raw string.
+    """,
+)
 
-    @typing.override
-    def accept[R](self, visitor: SyntaxErrorVisitor[R]) -> R:
-        return visitor.visit_unrecognized_character_error(self)
+UnrecognizedCharacterError = _make_error(
+    "UnrecognizedCharacterError",
+    AbstractSyntaxError,
+    "visit_unrecognized_character_error",
+    {"unrecognized_character": "str"},
+    """
+    Error triggered when a character that does not exist in the language is
+    found in the program.
+    """,
+)
 
 
 type SyntaxError = (  # noqa: A001
@@ -333,126 +595,89 @@ type SyntaxError = (  # noqa: A001
 )
 
 
-class AbstractGrammarError(AbstractCompilationError):
-    """
-    Represents an abstract grammar error.
-    """
-
-    @abc.abstractmethod
-    @typing.override
-    def accept[R](self, visitor: GrammarErrorVisitor[R]) -> R:
-        pass
-
-
-@attrs.frozen
-class IncompleteExpressionError(AbstractGrammarError):
+IncompleteExpressionError = _make_error(
+    "IncompleteExpressionError",
+    AbstractGrammarError,
+    "visit_incomplete_expression_error",
+    {"node_type": "type[vast.AstNode]", "missing_parts": "list[str]"},
     """
     Error triggered when an incomplete expression/statement is encountered.
-    """
-
-    node_type: type[vast.AstNode]
-    missing_parts: list[str]
-
-    @typing.override
-    def accept[R](self, visitor: GrammarErrorVisitor[R]) -> R:
-        return visitor.visit_incomplete_expression_error(self)
-
+    """,
+)
 
-@attrs.frozen
-class IncorrectKeywordKindError(AbstractGrammarError):
+IncorrectKeywordKindError = _make_error(
+    "IncorrectKeywordKindError",
+    AbstractGrammarError,
+    "visit_incorrect_keyword_kind_error",
+    {"keyword": "tokens.Token"},
     """
     Error triggered when an expression keyword is mistakenly used to start a
     statement.
-    """
-
-    keyword: tokens.Token
-
-    @typing.override
-    def accept[R](self, visitor: GrammarErrorVisitor[R]) -> R:
-        return visitor.visit_incorrect_keyword_kind_error(self)
-
+    """,
+)
 
-@attrs.frozen
-class KeywordMisuseError(AbstractGrammarError):
+KeywordMisuseError = _make_error(
+    "KeywordMisuseError",
+    AbstractGrammarError,
+    "visit_keyword_misuse_error",
+    {"keyword": "tokens.Token"},
     """
     Error triggered when a keyword is used in a place where it does not make
     sense.
-    """
-
-    keyword: tokens.Token
-
-    @typing.override
-    def accept[R](self, visitor: GrammarErrorVisitor[R]) -> R:
-        return visitor.visit_keyword_misuse_error(self)
-
+    """,
+)
 
-@attrs.frozen
-class MismatchedTokensError(AbstractGrammarError):
+MismatchedTokensError = _make_error(
+    "MismatchedTokensError",
+    AbstractGrammarError,
+    "visit_mismatched_tokens_error",
+    {"expected": "tokens.TokenKind", "found": "tokens.Token"},
     """
     Error triggered when a token kind is expected, but another is found.
-    """
-
-    expected: tokens.TokenKind
-    found: tokens.Token
-
-    @typing.override
-    def accept[R](self, visitor: GrammarErrorVisitor[R]) -> R:
-        return visitor.visit_mismatched_tokens_error(self)
-
+    """,
+)
 
-@attrs.frozen
-class UnexpectedEofError(AbstractGrammarError):
+UnexpectedEofError = _make_error(
+    "UnexpectedEofError",
+    AbstractGrammarError,
+    "visit_unexpected_eof_error",
+    {"node_type": "type[vast.AstNode]"},
     """
     Error triggered when the end of file is found during parsing an expression
     or a statement.
-    """
-
-    node_type: type[vast.AstNode]
-
-    @typing.override
-    def accept[R](self, visitor: GrammarErrorVisitor[R]) -> R:
-        return visitor.visit_unexpected_eof_error(self)
-
+    """,
+)
 
-@attrs.frozen
-class UnexpectedFirstClassExpressionError(AbstractGrammarError):
+UnexpectedFirstClassExpressionError = _make_error(
+    "UnexpectedFirstClassExpressionError",
+    AbstractGrammarError,
+    "visit_unexpected_first_class_expression_error",
+    {"unexpected_expr": "vast.Expr"},
     """
     Error triggered when a first-class expression is used.
     Indeed, there is no expression statement in Venus.
-    """
-
-    unexpected_expr: vast.Expr
-
-    @typing.override
-    def accept[R](self, visitor: GrammarErrorVisitor[R]) -> R:
-        return visitor.visit_unexpected_first_class_expression_error(self)
-
+    """,
+)
 
-@attrs.frozen
-class UnexpectedTokenError(AbstractGrammarError):
+UnexpectedTokenError = _make_error(
+    "UnexpectedTokenError",
+    AbstractGrammarError,
+    "visit_unexpected_token_error",
+    {"token": "tokens.Token"},
     """
     Error triggered when an unexpected token is found. (generic fallback)
-    """
-
-    token: tokens.Token
-
-    @typing.override
-    def accept[R](self, visitor: GrammarErrorVisitor[R]) -> R:
-        return visitor.visit_unexpected_token_error(self)
-
+    """,
+)
 
-@attrs.frozen
-class UnmatchedBracketError(AbstractGrammarError):
+UnmatchedBracketError = _make_error(
+    "UnmatchedBracketError",
+    AbstractGrammarError,
+    "visit_unmatched_bracket_error",
+    {"unmatched": "tokens.Token", "expected": "tokens.TokenKind"},
     """
     Error triggered when an unmatched bracket was found.
-    """
-
-    unmatched: tokens.Token
-    expected: tokens.TokenKind
-
-    @typing.override
-    def accept[R](self, visitor: GrammarErrorVisitor[R]) -> R:
-        return visitor.visit_unmatched_bracket_error(self)
+    """,
+)
 
 
 type GrammarError = (
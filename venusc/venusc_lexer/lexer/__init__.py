@@ -4,6 +4,7 @@ Lexer of Venus.
 
 from __future__ import annotations
 
+import re
 import typing
 
 import error
@@ -12,7 +13,116 @@ import tokens
 
 from lexer.utils import is_identifier
 
-STRING_TERMINATORS = {'"', "\n"}
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+# ASCII whitespace, skipped between tokens.
+_WHITESPACE: typing.Final = b" \r\t\n"
+# The newline byte, which a string literal must not run into.
+_NEWLINE: typing.Final = 0x0A
+
+# Token kinds and the keyword mapping, bound as module-level names once
+# so the hot scanning paths skip the EnumMeta attribute lookup (and the
+# dict attribute load) on every token.
+_TK = tokens.TokenKind
+_EOF = _TK.EOF
+_IDENTIFIER = _TK.IDENTIFIER
+_NATURAL = _TK.NATURAL
+_STRING = _TK.STRING
+# Identifier-alike lexemes bucketed by length. Most identifiers have a
+# length no keyword has (or miss the tiny bucket after a comparison or
+# three), which beats hashing every identifier lexeme for a dict probe
+# that usually misses.
+_KW_MAX_LENGTH: typing.Final = max(
+    map(len, tokens.IDENTIFIER_ALIKE_MAPPING),
+)
+_KW_BY_LEN: typing.Final[
+    list[tuple[tuple[str, tokens.TokenKind], ...] | None]
+] = [None] * (_KW_MAX_LENGTH + 1)
+
+for _lexeme, _keyword_kind in tokens.IDENTIFIER_ALIKE_MAPPING.items():
+    _bucket = _KW_BY_LEN[len(_lexeme)] or ()
+    _KW_BY_LEN[len(_lexeme)] = (*_bucket, (_lexeme, _keyword_kind))
+
+del _lexeme, _keyword_kind, _bucket
+
+# Inner-loop scanners. A star-quantified character class always
+# matches, and `match(source, position)` runs the whole scan inside the
+# regex engine instead of one peek/advance call pair per character.
+_IDENTIFIER_RE = re.compile(rb"[A-Za-z0-9_]*")
+_NATURAL_RE = re.compile(rb"[0-9]*")
+_STRING_RE = re.compile(rb'[^"\n]*')
+
+
+class _LexError(Exception):
+    """
+    Internal signal carrying a syntax error out of the scan loop.
+
+    Raising on the rare error path lets the per-token fast path return
+    bare `TokenKind`s instead of allocating a `result.Ok` wrapper that
+    `lex` immediately unwraps.
+    """
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: error.SyntaxError) -> None:
+        super().__init__(payload)
+        self.payload = payload
+
+
+def _scan_identifier(lexer: Lexer) -> tokens.TokenKind:
+    return lexer.scan_identifier()
+
+
+# Token table indexed by code point, from which `_compile_scan_token`
+# derives the scanner. An entry is either a `TokenKind` (the character
+# alone makes the token), the identifier marker, or `None` for
+# characters no token starts with; naturals and strings keep their
+# hard-coded range and quote tests in the compiled function.
+_DISPATCH: typing.Final[
+    list[tokens.TokenKind | Callable[[Lexer], tokens.TokenKind] | None]
+] = [None] * 256
+
+for _char, _kind in (
+    ("[", _TK.LEFT_BRACKET),
+    ("]", _TK.RIGHT_BRACKET),
+    (")", _TK.RIGHT_PAREN),
+    ("^", _TK.CARET),
+    ("+", _TK.PLUS),
+    ("/", _TK.SLASH),
+    ("*", _TK.STAR),
+    (",", _TK.COMMA),
+    ("%", _TK.PERCENT),
+    (".", _TK.PERIOD),
+    (";", _TK.SEMICOLON),
+    ("=", _TK.EQUAL),
+    ("(", _TK.LEFT_PAREN),
+    ("-", _TK.MINUS),
+    (":", _TK.COLON),
+    (">", _TK.GREATER),
+    ("<", _TK.LESS),
+):
+    _DISPATCH[ord(_char)] = _kind
+
+# Two-byte tokens, keyed by both bytes packed into one int; the
+# compiled scanner nests each second-byte test under its opening
+# byte's branch.
+_TWOCHAR: typing.Final[dict[int, tokens.TokenKind]] = {
+    (ord(first) << 8) | ord(second): kind
+    for (first, second), kind in {
+        ("(", ")"): _TK.UNIT,
+        ("-", ">"): _TK.RIGHT_ARROW,
+        (":", "="): _TK.COLON_EQUAL,
+        (">", "="): _TK.GREATER_EQUAL,
+        ("<", "="): _TK.LESS_EQUAL,
+    }.items()
+}
+
+for _code in range(256):
+    if is_identifier(chr(_code), first_char=True):
+        _DISPATCH[_code] = _scan_identifier
+
+del _char, _kind, _code
 
 
 class Lexer:
@@ -24,6 +134,12 @@ class Lexer:
 
     def __init__(self, source: str) -> None:
         self.source: typing.Final = source
+        # The scanner walks the UTF-8 encoding of the source: indexing
+        # bytes yields small ints, so the hot loop compares integers
+        # instead of allocating one-character strings. `start` and
+        # `current` are byte offsets (equal to character offsets for
+        # ASCII sources).
+        self.buffer: typing.Final = source.encode("utf-8")
 
         self.start = self.current = 0
 
@@ -43,22 +159,22 @@ class Lexer:
         bool
         """
 
-        return self.current >= len(self.source)
+        return self.current >= len(self.buffer)
 
-    def peek(self) -> str | typing.Literal["\0"]:  # noqa: PYI051
+    def peek(self) -> int:
         """
-        Peek the source for the current character.
+        Peek the source for the current byte.
 
         Returns
         -------
-        A null character if there is no more characters in the source.
-        Otherwise, the character at the current position.
+        Zero if there is no more bytes in the source. Otherwise, the
+        byte at the current position.
         """
 
         if self.is_at_end():
-            return "\0"
+            return 0
 
-        return self.source[self.current]
+        return self.buffer[self.current]
 
     def advance(self) -> None:
         """
@@ -67,14 +183,14 @@ class Lexer:
 
         self.current += 1
 
-    def consume(self) -> str | typing.Literal["\0"]:  # noqa: PYI051
+    def consume(self) -> int:
         """
-        Consume the current character of the source.
+        Consume the current byte of the source.
 
         Returns
         -------
-        The consumed character or null character if there is no more characters
-        in the source.
+        The consumed byte or zero if there is no more bytes in the
+        source.
         """
 
         char = self.peek()
@@ -91,7 +207,7 @@ class Lexer:
         str
         """
 
-        return self.source[self.start : self.current]
+        return self.buffer[self.start : self.current].decode("utf-8")
 
     def get_span(self) -> tuple[int, int]:
         """
@@ -113,13 +229,22 @@ class Lexer:
         TokenKind
         """
 
-        while is_identifier(self.peek()):
-            self.advance()
+        match = _IDENTIFIER_RE.match(self.buffer, self.current)
+        assert match is not None  # noqa: S101 # star patterns always match
+        self.current = match.end()
+
+        length = self.current - self.start
+
+        if length > _KW_MAX_LENGTH or (bucket := _KW_BY_LEN[length]) is None:
+            return _IDENTIFIER
 
-        return tokens.KEYWORD_MAPPING.get(
-            self.get_lexeme(),
-            tokens.TokenKind.IDENTIFIER,
-        )
+        lexeme = self.get_lexeme()
+
+        for candidate, kind in bucket:
+            if lexeme == candidate:
+                return kind
+
+        return _IDENTIFIER
 
     def scan_natural(self) -> tokens.TokenKind:
         """
@@ -130,131 +255,43 @@ class Lexer:
         TokenKind
         """
 
-        while self.peek().isdecimal():
-            self.advance()
+        match = _NATURAL_RE.match(self.buffer, self.current)
+        assert match is not None  # noqa: S101 # star patterns always match
+        self.current = match.end()
 
-        return tokens.TokenKind.NATURAL
+        return _NATURAL
 
-    def scan_string(self) -> result.Result[tokens.TokenKind, error.SyntaxError]:
+    def scan_string(self) -> tokens.TokenKind:
         """
         Scan a string.
 
         Returns
         -------
-        Either TokenKind or SyntaxError
+        TokenKind
+
+        Raises
+        ------
+        _LexError
+            If the closing quote could not be found.
         """
 
-        while not self.is_at_end() and self.peek() not in STRING_TERMINATORS:
-            self.advance()
+        buffer = self.buffer
+        match = _STRING_RE.match(buffer, self.current)
+        assert match is not None  # noqa: S101 # star patterns always match
+        current = match.end()
+
+        if current >= len(buffer) or buffer[current] == _NEWLINE:
+            self.current = current
 
-        if self.is_at_end() or self.peek() == "\n":
-            return result.Err(
+            raise _LexError(
                 error.UnclosedStringError(
                     self.get_span(),
                 ),
             )
 
-        self.advance()  # consume the trailing quote
-
-        return result.Ok(tokens.TokenKind.STRING)
+        self.current = current + 1  # consume the trailing quote
 
-    def scan_token(self) -> result.Result[tokens.TokenKind, error.SyntaxError]:  # noqa: C901, PLR0912, PLR0915
-        """
-        Scan a token.
-
-        Returns
-        -------
-        Either TokenKind or SyntaxError
-        """
-
-        kind: tokens.TokenKind | None = None
-
-        while kind is None:
-            match self.consume():
-                case "\0":
-                    kind = tokens.TokenKind.EOF
-                case " " | "\r" | "\t" | "\n":
-                    self.reset_start()
-                # *- Atoms -* #
-                case char if is_identifier(char, first_char=True):
-                    kind = self.scan_identifier()
-                # *- Groupers -* #
-                case "[":
-                    kind = tokens.TokenKind.LEFT_BRACKET
-                case "(":
-                    if self.peek() == ")":
-                        self.advance()
-                        kind = tokens.TokenKind.UNIT
-                    else:
-                        kind = tokens.TokenKind.LEFT_PAREN
-                case "]":
-                    kind = tokens.TokenKind.RIGHT_BRACKET
-                case ")":
-                    kind = tokens.TokenKind.RIGHT_PAREN
-                # *- Literals -* #
-                case char if char.isdecimal():
-                    kind = self.scan_natural()
-                case '"':
-                    scan_result = self.scan_string()
-
-                    if isinstance(scan_result, result.Err):
-                        return scan_result
-
-                    kind = scan_result.unwrap()
-                # *- Operators -* #
-                case "^":
-                    kind = tokens.TokenKind.CARET
-                case "-":
-                    if self.peek() == ">":
-                        self.advance()
-                        kind = tokens.TokenKind.RIGHT_ARROW
-                    else:
-                        kind = tokens.TokenKind.MINUS
-                case "+":
-                    kind = tokens.TokenKind.PLUS
-                case "/":
-                    kind = tokens.TokenKind.SLASH
-                case "*":
-                    kind = tokens.TokenKind.STAR
-                # *- Punctuation -* #
-                case ":":
-                    if self.peek() == "=":
-                        self.advance()
-                        kind = tokens.TokenKind.COLON_EQUAL
-                    else:
-                        kind = tokens.TokenKind.COLON
-                case ",":
-                    kind = tokens.TokenKind.COMMA
-                case "%":
-                    kind = tokens.TokenKind.PERCENT
-                case ".":
-                    kind = tokens.TokenKind.PERIOD
-                case ";":
-                    kind = tokens.TokenKind.SEMICOLON
-                # *- Relations -* #
-                case "=":
-                    kind = tokens.TokenKind.EQUAL
-                case ">":
-                    if self.peek() == "=":
-                        self.advance()
-                        kind = tokens.TokenKind.GREATER_EQUAL
-                    else:
-                        kind = tokens.TokenKind.GREATER
-                case "<":
-                    if self.peek() == "=":
-                        self.advance()
-                        kind = tokens.TokenKind.LESS_EQUAL
-                    else:
-                        kind = tokens.TokenKind.LESS
-                case char:
-                    return result.Err(
-                        error.UnrecognizedCharacterError(
-                            self.get_span(),
-                            char,
-                        ),
-                    )
-
-        return result.Ok(kind)
+        return _STRING
 
     def build_token(self, kind: tokens.TokenKind) -> tokens.Token:
         """
@@ -265,30 +302,156 @@ class Lexer:
         The token.
         """
 
-        return tokens.Token(kind, self.get_lexeme(), self.start)
+        return tokens.Token(kind, self.start, self.current, self.buffer)
 
-    def lex(self) -> result.Result[list[tokens.Token], error.SyntaxError]:
+    def lex(self) -> result.Result[tokens.TokenStream, error.SyntaxError]:
         """
         Scan the tokens.
 
         Returns
         -------
-        Either the list of tokens or a syntax error.
+        Either the token stream or a syntax error.
         """
 
-        token_list: list[tokens.Token] = []
+        stream = tokens.TokenStream(self.buffer)
 
-        while not self.is_at_end():
-            self.reset_start()
+        try:
+            while not self.is_at_end():
+                self.reset_start()
+                stream.append(self.scan_token(), self.start, self.current)
+        except _LexError as exception:
+            return result.Err(exception.payload)
 
-            scan_result = self.scan_token()
+        self.reset_start()
+        stream.append(_EOF, self.start, self.current)
 
-            if isinstance(scan_result, result.Err):
-                return scan_result
+        return result.Ok(stream)
 
-            token_list.append(self.build_token(scan_result.unwrap()))
 
-        self.reset_start()
-        token_list.append(self.build_token(tokens.TokenKind.EOF))
+def _compile_scan_token() -> Callable[[Lexer], tokens.TokenKind]:
+    """
+    Compile a `scan_token` specialized to the current token tables.
+
+    Venus' token set is fixed, so the table lookups can be partially
+    evaluated away: the emitted function is a straight line of integer
+    comparisons derived from `_DISPATCH` and `_TWOCHAR`, with the token
+    kinds baked in as globals — nothing sits between dispatch and
+    action.
+
+    Returns
+    -------
+    The compiled function.
+    """
 
-        return result.Ok(token_list)
+    namespace: dict[str, typing.Any] = {
+        "_WHITESPACE": _WHITESPACE,
+        "_EOF": _EOF,
+        "_ID_START": bytes(
+            1 if _DISPATCH[code] is _scan_identifier else 0
+            for code in range(256)
+        ),
+        "_LexError": _LexError,
+        "error": error,
+    }
+
+    lines = [
+        "def scan_token(self):",
+        "    buffer = self.buffer",
+        "    length = len(buffer)",
+        "    current = self.current",
+        "",
+        "    while current < length and buffer[current] in _WHITESPACE:",
+        "        current += 1",
+        "",
+        "    self.start = current",
+        "",
+        "    if current >= length:",
+        "        self.current = current",
+        "",
+        "        return _EOF",
+        "",
+        "    char = buffer[current]",
+        "    current += 1",
+        "",
+        "    if _ID_START[char]:",
+        "        self.current = current",
+        "",
+        "        return self.scan_identifier()",
+        "",
+        "    if 0x30 <= char <= 0x39:",
+        "        self.current = current",
+        "",
+        "        return self.scan_natural()",
+        "",
+        "    if char == 0x22:",
+        "        self.current = current",
+        "",
+        "        return self.scan_string()",
+    ]
+
+    compounds: dict[int, list[tuple[int, tokens.TokenKind]]] = {}
+
+    for key, compound in _TWOCHAR.items():
+        compounds.setdefault(key >> 8, []).append((key & 0xFF, compound))
+
+    for code in range(256):
+        entry = _DISPATCH[code]
+
+        if type(entry) is not _TK:
+            continue
+
+        name = f"_K_{entry.name}"
+        namespace[name] = entry
+        lines.extend((
+            "",
+            f"    if char == {code:#04x}:  # {chr(code)!r}",
+        ))
+
+        for second, compound in compounds.get(code, ()):
+            compound_name = f"_K_{compound.name}"
+            namespace[compound_name] = compound
+            lines.extend((
+                f"        if current < length"
+                f" and buffer[current] == {second:#04x}:  # {chr(second)!r}",
+                "            self.current = current + 1",
+                "",
+                f"            return {compound_name}",
+                "",
+            ))
+
+        lines.extend((
+            "        self.current = current",
+            "",
+            f"        return {name}",
+        ))
+
+    lines += [
+        "",
+        "    self.current = current",
+        "",
+        "    raise _LexError(",
+        "        error.UnrecognizedCharacterError(",
+        "            self.get_span(),",
+        "            buffer[self.start : self.start + 4]",
+        '            .decode("utf-8", "replace")[:1],',
+        "        ),",
+        "    )",
+    ]
+
+    exec(  # noqa: S102
+        compile("\n".join(lines), "<scan_token>", "exec"),
+        namespace,
+    )
+
+    function = namespace["scan_token"]
+    function.__qualname__ = "Lexer.scan_token"
+    function.__doc__ = (
+        "Scan a token. Compiled at import by `_compile_scan_token`;"
+        " raises `_LexError` if no token starts with the consumed"
+        " character."
+    )
+
+    return function
+
+
+Lexer.scan_token = _compile_scan_token()
@@ -4,6 +4,19 @@ Various utils for lexing.
 
 from __future__ import annotations
 
+# Identifiers are ASCII-only; anything at or past this code point is
+# never identifier material.
+_ASCII_LIMIT = 128
+
+# Identifier character classes as a 128-byte table: bit 0 marks
+# characters valid anywhere in an identifier (letters, underscore) and
+# bit 1 those only valid past the first position (digits). One indexed
+# load replaces the four range comparisons done per character before.
+_ID_TABLE = bytes(
+    1 if char == "_" or char.isalpha() else 2 if char.isdigit() else 0
+    for char in map(chr, range(_ASCII_LIMIT))
+)
+
 
 def is_identifier(char: str, *, first_char: bool = False) -> bool:
     """
@@ -21,9 +34,8 @@ def is_identifier(char: str, *, first_char: bool = False) -> bool:
     bool
     """
 
+    code = ord(char)
+
     return (
-        char == "_"
-        or "A" <= char <= "Z"
-        or "a" <= char <= "z"
-        or ("0" <= char <= "9" and not first_char)
+        code < _ASCII_LIMIT and _ID_TABLE[code] & (1 if first_char else 3) != 0
     )
@@ -86,7 +86,10 @@ class TokenKindCategoryVisitor[R_co](typing.Protocol):
         ...
 
 
-@attrs.frozen
+# The categories are singletons reached through `TokenKind`; identity
+# comparison (eq=False) spares the generated field-walking __eq__ and
+# __hash__ whenever a category lands in a dict or an equality test.
+@attrs.frozen(eq=False)
 class AbstractTokenKindCategory(abc.ABC):
     """
     Represents an abstract token kind category.
@@ -101,7 +104,7 @@ class AbstractTokenKindCategory(abc.ABC):
         """
 
 
-@attrs.frozen
+@attrs.frozen(eq=False)
 class Atom(AbstractTokenKindCategory):
     """
     Represents atom token kinds, e.g. `IDENTIFIER`.
@@ -115,7 +118,7 @@ class Atom(AbstractTokenKindCategory):
         return visitor.visit_atom_category(self)
 
 
-@attrs.frozen
+@attrs.frozen(eq=False)
 class Grouper(AbstractTokenKindCategory):
     """
     Represents grouper token kinds, e.g. parentheses.
@@ -128,7 +131,7 @@ class Grouper(AbstractTokenKindCategory):
         return visitor.visit_grouper_category(self)
 
 
-@attrs.frozen
+@attrs.frozen(eq=False)
 class Keyword(AbstractTokenKindCategory):
     """
     Represents keyword token kinds, e.g. `LET` or `MATCH`.
@@ -143,7 +146,7 @@ class Keyword(AbstractTokenKindCategory):
         return visitor.visit_keyword_category(self)
 
 
-@attrs.frozen
+@attrs.frozen(eq=False)
 class Literal(AbstractTokenKindCategory):
     """
     Represents literal token kinds, e.g. `INTEGER` or `STRING`.
@@ -158,7 +161,7 @@ class Literal(AbstractTokenKindCategory):
         return visitor.visit_literal_category(self)
 
 
-@attrs.frozen
+@attrs.frozen(eq=False)
 class Miscellaneous(AbstractTokenKindCategory):
     """
     Represents miscellaneous token kinds, such as `EOF`.
@@ -172,7 +175,7 @@ class Miscellaneous(AbstractTokenKindCategory):
         return visitor.visit_misc_category(self)
 
 
-@attrs.frozen
+@attrs.frozen(eq=False)
 class Operator(AbstractTokenKindCategory):
     """
     Represents operator token kinds, such as `PLUS`.
@@ -187,7 +190,7 @@ class Operator(AbstractTokenKindCategory):
         return visitor.visit_operator_category(self)
 
 
-@attrs.frozen
+@attrs.frozen(eq=False)
 class Punctuation(AbstractTokenKindCategory):
     """
     Represents punctuation token kinds, such as `COMMA`.
@@ -200,7 +203,7 @@ class Punctuation(AbstractTokenKindCategory):
         return visitor.visit_punctuation_category(self)
 
 
-@attrs.frozen
+@attrs.frozen(eq=False)
 class Relation(AbstractTokenKindCategory):
     """
     Represents relation token kinds, such as `EQUAL`.
@@ -17,74 +17,134 @@ from .category import Miscellaneous
 from .category import Operator
 from .category import Punctuation
 from .category import Relation
+from .category import TokenKindCategory
 from .infix import Associativity
 
 
-class TokenKind(enum.Enum):
+class TokenKind(enum.IntEnum):
     """
     Represents a token kind.
+
+    Members are plain ints (explicit, stable values), so equality and
+    hashing are C-level integer operations; the category payload lives
+    in the `CATEGORY` table and stays reachable through `value` below.
     """
 
-    IDENTIFIER = Atom()
-
-    LEFT_BRACKET = Grouper("[")
-    LEFT_PAREN = Grouper("(")
-    RIGHT_BRACKET = Grouper("]")
-    RIGHT_PAREN = Grouper(")")
-
-    AND = Keyword("and", KeywordKind.EXPRESSION_CONJUNCTIVE)
-    CASE = Keyword("case", KeywordKind.EXPRESSION_CONJUNCTIVE)
-    DISCARD = Keyword("discard", KeywordKind.EXPRESSION_STARTER)
-    ELSE = Keyword("else", KeywordKind.EXPRESSION_CONJUNCTIVE)
-    END = Keyword("end", KeywordKind.EXPRESSION_CONJUNCTIVE)
-    FIX = Keyword("fix", KeywordKind.STATEMENT_STARTER)
-    IF = Keyword("if", KeywordKind.EXPRESSION_STARTER)
-    LET = Keyword("let", KeywordKind.STATEMENT_STARTER)
-    MATCH = Keyword("match", KeywordKind.EXPRESSION_STARTER)
-    OR = Keyword("or", KeywordKind.EXPRESSION_CONJUNCTIVE)
-    PROOF = Keyword("proof", KeywordKind.STATEMENT_STARTER)  # unused
-    THEN = Keyword("then", KeywordKind.EXPRESSION_CONJUNCTIVE)
-    USE = Keyword("use", KeywordKind.STATEMENT_STARTER)
-    WHERE = Keyword("where", KeywordKind.STATEMENT_CONJUNCTIVE)
-
-    NATURAL = Literal(type.PrimitiveKind.NATURAL)
-    STRING = Literal(type.PrimitiveKind.STRING)
-    UNIT = Literal(type.PrimitiveKind.UNIT)
-
-    EOF = Miscellaneous()
-
-    CARET = Operator("^", Associativity.RIGHT, precedence=5)
+    IDENTIFIER = 0
+
+    LEFT_BRACKET = 1
+    LEFT_PAREN = 2
+    RIGHT_BRACKET = 3
+    RIGHT_PAREN = 4
+
+    AND = 5
+    CASE = 6
+    DISCARD = 7
+    ELSE = 8
+    END = 9
+    FIX = 10
+    IF = 11
+    LET = 12
+    MATCH = 13
+    OR = 14
+    PROOF = 15  # unused
+    THEN = 16
+    USE = 17
+    WHERE = 18
+
+    NATURAL = 19
+    STRING = 20
+    UNIT = 21
+
+    EOF = 22
+
+    CARET = 23
+    COLON_EQUAL = 24
+    MINUS = 25
+    MODULO = 26
+    PLUS = 27
+    SLASH = 28
+    STAR = 29
+
+    COLON = 30
+    COMMA = 31
+    PERCENT = 32
+    PERIOD = 33
+    RIGHT_ARROW = 34
+    SEMICOLON = 35
+
+    EQUAL = 36
+    GREATER = 37
+    GREATER_EQUAL = 38
+    IS = 39
+    LESS = 40
+    LESS_EQUAL = 41
+
+    @property
+    def value(self) -> TokenKindCategory:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Category payload of the kind, as with the previous Enum values.
+        """
+
+        return CATEGORY[self]
+
+
+CATEGORY: dict[TokenKind, TokenKindCategory] = {
+    TokenKind.IDENTIFIER: Atom(),
+    TokenKind.LEFT_BRACKET: Grouper("["),
+    TokenKind.LEFT_PAREN: Grouper("("),
+    TokenKind.RIGHT_BRACKET: Grouper("]"),
+    TokenKind.RIGHT_PAREN: Grouper(")"),
+    TokenKind.AND: Keyword("and", KeywordKind.EXPRESSION_CONJUNCTIVE),
+    TokenKind.CASE: Keyword("case", KeywordKind.EXPRESSION_CONJUNCTIVE),
+    TokenKind.DISCARD: Keyword("discard", KeywordKind.EXPRESSION_STARTER),
+    TokenKind.ELSE: Keyword("else", KeywordKind.EXPRESSION_CONJUNCTIVE),
+    TokenKind.END: Keyword("end", KeywordKind.EXPRESSION_CONJUNCTIVE),
+    TokenKind.FIX: Keyword("fix", KeywordKind.STATEMENT_STARTER),
+    TokenKind.IF: Keyword("if", KeywordKind.EXPRESSION_STARTER),
+    TokenKind.LET: Keyword("let", KeywordKind.STATEMENT_STARTER),
+    TokenKind.MATCH: Keyword("match", KeywordKind.EXPRESSION_STARTER),
+    TokenKind.OR: Keyword("or", KeywordKind.EXPRESSION_CONJUNCTIVE),
+    TokenKind.PROOF: Keyword("proof", KeywordKind.STATEMENT_STARTER),
+    TokenKind.THEN: Keyword("then", KeywordKind.EXPRESSION_CONJUNCTIVE),
+    TokenKind.USE: Keyword("use", KeywordKind.STATEMENT_STARTER),
+    TokenKind.WHERE: Keyword("where", KeywordKind.STATEMENT_CONJUNCTIVE),
+    TokenKind.NATURAL: Literal(type.PrimitiveKind.NATURAL),
+    TokenKind.STRING: Literal(type.PrimitiveKind.STRING),
+    TokenKind.UNIT: Literal(type.PrimitiveKind.UNIT),
+    TokenKind.EOF: Miscellaneous(),
+    TokenKind.CARET: Operator("^", Associativity.RIGHT, precedence=5),
     # NOTE: Special-cased operator that isn't actually considered as such.
-    # NOTE: Marked as right-associative for documentation ; same for precedence.
-    COLON_EQUAL = Operator(":=", Associativity.RIGHT, precedence=0)
+    # NOTE: Marked as right-associative for documentation ; same for
+    # precedence.
+    TokenKind.COLON_EQUAL: Operator(":=", Associativity.RIGHT, precedence=0),
     # NOTE: We don't start at 1 to leave some room for lower operators
-    MINUS = Operator("-", precedence=3)
-    MODULO = Operator("mod", precedence=4, is_identifier_alike=True)
-    PLUS = Operator("+", precedence=3)
-    SLASH = Operator("/", precedence=4)
-    STAR = Operator("*", precedence=4)
-
-    COLON = Punctuation(":")  # means "in set"/"of type"
-    COMMA = Punctuation(",")  # for tuples
-    PERCENT = Punctuation("%")  # for refining literal type
-    PERIOD = Punctuation(".")  # namespaces
-    RIGHT_ARROW = Punctuation("->")  # functions & pattern matching
-    SEMICOLON = Punctuation(";")  # end of expression marker
-
-    EQUAL = Relation("=")
-    GREATER = Relation(">")
-    GREATER_EQUAL = Relation(">=")
-    IS = Relation("is", is_identifier_alike=True)
-    LESS = Relation("<")
-    LESS_EQUAL = Relation("<=")
+    TokenKind.MINUS: Operator("-", precedence=3),
+    TokenKind.MODULO: Operator("mod", precedence=4, is_identifier_alike=True),
+    TokenKind.PLUS: Operator("+", precedence=3),
+    TokenKind.SLASH: Operator("/", precedence=4),
+    TokenKind.STAR: Operator("*", precedence=4),
+    TokenKind.COLON: Punctuation(":"),  # means "in set"/"of type"
+    TokenKind.COMMA: Punctuation(","),  # for tuples
+    TokenKind.PERCENT: Punctuation("%"),  # for refining literal type
+    TokenKind.PERIOD: Punctuation("."),  # namespaces
+    TokenKind.RIGHT_ARROW: Punctuation("->"),  # functions & pattern matching
+    TokenKind.SEMICOLON: Punctuation(";"),  # end of expression marker
+    TokenKind.EQUAL: Relation("="),
+    TokenKind.GREATER: Relation(">"),
+    TokenKind.GREATER_EQUAL: Relation(">="),
+    TokenKind.IS: Relation("is", is_identifier_alike=True),
+    TokenKind.LESS: Relation("<"),
+    TokenKind.LESS_EQUAL: Relation("<="),
+}
 
 
 # "Identifier-alike" includes keywords or any operator that would, without
 # knowledge of its existence, be tokenized as an identifier.
 IDENTIFIER_ALIKE_MAPPING: dict[str, TokenKind] = {
-    kind.value.lexeme: kind
-    for kind in TokenKind
-    if kind.value.is_identifier_alike
+    category.lexeme: kind
+    for kind, category in CATEGORY.items()
+    if category.is_identifier_alike
 }
 
 
@@ -97,9 +157,11 @@ def starts_statement(kind: TokenKind) -> bool:
     bool
     """
 
+    category = CATEGORY[kind]
+
     return (
-        isinstance(kind.value, Keyword)
-        and kind.value.kind is KeywordKind.STATEMENT_STARTER
+        isinstance(category, Keyword)
+        and category.kind is KeywordKind.STATEMENT_STARTER
     )
 
 
@@ -112,9 +174,11 @@ def is_statement_conjunctive(kind: TokenKind) -> bool:
     bool
     """
 
+    category = CATEGORY[kind]
+
     return (
-        isinstance(kind.value, Keyword)
-        and kind.value.kind is KeywordKind.STATEMENT_CONJUNCTIVE
+        isinstance(category, Keyword)
+        and category.kind is KeywordKind.STATEMENT_CONJUNCTIVE
     )
 
 
@@ -127,9 +191,11 @@ def starts_expression(kind: TokenKind) -> bool:
     bool
     """
 
+    category = CATEGORY[kind]
+
     return (
-        isinstance(kind.value, Keyword)
-        and kind.value.kind is KeywordKind.EXPRESSION_STARTER
+        isinstance(category, Keyword)
+        and category.kind is KeywordKind.EXPRESSION_STARTER
     )
 
 
@@ -142,7 +208,9 @@ def is_expression_conjunctive(kind: TokenKind) -> bool:
     bool
     """
 
+    category = CATEGORY[kind]
+
     return (
-        isinstance(kind.value, Keyword)
-        and kind.value.kind is KeywordKind.EXPRESSION_CONJUNCTIVE
+        isinstance(category, Keyword)
+        and category.kind is KeywordKind.EXPRESSION_CONJUNCTIVE
     )
@@ -4,20 +4,42 @@ Definition of the token data structure.
 
 from __future__ import annotations
 
+import array
+import sys
 import typing
 
+from .category import Atom
+from .category import Literal
+from .category import Miscellaneous
+from .kind import CATEGORY
+from .kind import TokenKind
+
 if typing.TYPE_CHECKING:
-    from .kind import TokenKind
+    from collections.abc import Iterator
+
+# Lexemes of the token kinds whose spelling is fixed by the language
+# (keywords, operators, punctuation...). Only atoms, literals and
+# miscellaneous kinds need their lexeme read back from the source.
+_FIXED_LEXEMES: dict[TokenKind, str] = {
+    kind: category.lexeme
+    for kind, category in CATEGORY.items()
+    if not isinstance(category, (Atom, Literal, Miscellaneous))
+}
 
 
 class Token(typing.NamedTuple):
     """
     Represents a token.
+
+    A token records its span and a reference to the UTF-8 source buffer
+    it was scanned from; the lexeme is materialized on demand, and only
+    sliced out of the buffer when the spelling is not fixed by the kind.
     """
 
     kind: TokenKind
-    lexeme: str
-    offset: int
+    start: int
+    end: int
+    source: bytes
 
     @property
     def span(self) -> tuple[int, int]:
@@ -25,4 +47,98 @@ class Token(typing.NamedTuple):
         Span of the token, i.e. the position range in the source.
         """
 
-        return (self.offset, self.offset + len(self.lexeme))
+        return (self.start, self.end)
+
+    @property
+    def lexeme(self) -> str:
+        """
+        Lexeme of the token.
+
+        Fixed-spelling kinds share their category's lexeme string; the
+        others decode their slice of the source buffer.
+        """
+
+        fixed = _FIXED_LEXEMES.get(self.kind)
+
+        if fixed is not None:
+            return fixed
+
+        lexeme = self.source[self.start : self.end].decode("utf-8")
+
+        if self.kind is TokenKind.IDENTIFIER:
+            # The same names recur constantly in a program; interning
+            # makes every occurrence share one string and lets
+            # downstream comparisons short-circuit on identity.
+            return sys.intern(lexeme)
+
+        return lexeme
+
+
+# Members keyed by their (dense) integer value, used by `TokenStream`
+# to rebuild the member from the stored int.
+_KIND_BY_ID: typing.Final = tuple(TokenKind)
+
+
+class TokenStream:
+    """
+    Struct-of-arrays token storage.
+
+    Kinds, starts and ends live in three parallel arrays of 32-bit
+    integers — 12 bytes per token, contiguous — with one shared
+    reference to the source buffer. `Token` views are materialized on
+    demand when a consumer indexes or iterates the stream.
+    """
+
+    __slots__ = ("ends", "kinds", "source", "starts")
+
+    def __init__(self, source: bytes) -> None:
+        self.source: typing.Final = source
+        self.kinds = array.array("i")
+        self.starts = array.array("i")
+        self.ends = array.array("i")
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> Token:
+        return Token(
+            _KIND_BY_ID[self.kinds[index]],
+            self.starts[index],
+            self.ends[index],
+            self.source,
+        )
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self.kinds)):
+            yield self[index]
+
+    def append(self, kind: TokenKind, start: int, end: int) -> None:
+        """
+        Append a token to the stream.
+        """
+
+        self.kinds.append(kind)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def kind_of(self, index: int) -> TokenKind:
+        """
+        Return the kind of the token at `index` without building a view.
+
+        Returns
+        -------
+        TokenKind
+        """
+
+        return _KIND_BY_ID[self.kinds[index]]
+
+    def span_of(self, index: int) -> tuple[int, int]:
+        """
+        Return the span of the token at `index` without building a view.
+
+        Returns
+        -------
+        (int, int)
+        """
+
+        return (self.starts[index], self.ends[index])
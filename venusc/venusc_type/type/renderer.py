@@ -6,7 +6,6 @@ Renderer for types.
 
 from __future__ import annotations
 
-import io
 import typing
 
 from .lib import ApplicationType
@@ -19,8 +18,24 @@ from .utils import is_atomic
 class TypeRenderer(TypeVisitor[str]):
     """
     Renderer for types.
+
+    Rendering recursions go through `render`, which dispatches on the
+    node's concrete class via a table instead of the two Python calls
+    of the `accept` round-trip; `accept` still works for external
+    callers.
     """
 
+    def render(self, typ: ApplicationType | PrimitiveType | ProductType) -> str:
+        """
+        Render a type.
+
+        Returns
+        -------
+        str
+        """
+
+        return self._DISPATCH[type(typ)](self, typ)
+
     # TODO: move this method to a dedicated colorer class
     def render_type_name(self, name: str) -> str:  # noqa: PLR6301
         """
@@ -47,25 +62,13 @@ class TypeRenderer(TypeVisitor[str]):
 
     @typing.override
     def visit_application_type(self, typ: ApplicationType) -> str:
-        buffer = io.StringIO()
-
-        parameter = typ.parameter.accept(self)
-        applied = typ.applied.accept(self)
+        parameter = self.render(typ.parameter)
+        applied = self.render(typ.applied)
 
-        is_parameter_atomic = is_atomic(typ.parameter)
+        if is_atomic(typ.parameter):
+            return f"{parameter} -> {applied}"
 
-        if not is_parameter_atomic:
-            buffer.write("(")
-
-        buffer.write(parameter)
-
-        if not is_parameter_atomic:
-            buffer.write(")")
-
-        buffer.write(" -> ")
-        buffer.write(applied)
-
-        return buffer.getvalue()
+        return f"({parameter}) -> {applied}"
 
     @typing.override
     def visit_primitive_type(self, typ: PrimitiveType) -> str:
@@ -73,34 +76,21 @@ class TypeRenderer(TypeVisitor[str]):
 
     @typing.override
     def visit_product_type(self, typ: ProductType) -> str:
-        buffer = io.StringIO()
-
-        left = typ.left.accept(self)
-        right = typ.right.accept(self)
-
-        left_parenthesized = not (
-            is_atomic(typ.left) or isinstance(typ.left, ProductType)
-        )
-        right_parenthesized = not (
-            is_atomic(typ.right) or isinstance(typ.right, ProductType)
-        )
-
-        if left_parenthesized:
-            buffer.write("(")
-
-        buffer.write(left)
-
-        if left_parenthesized:
-            buffer.write(")")
-
-        buffer.write(", ")
+        left = self.render(typ.left)
+        right = self.render(typ.right)
 
-        if right_parenthesized:
-            buffer.write("(")
+        if not (is_atomic(typ.left) or isinstance(typ.left, ProductType)):
+            left = f"({left})"
 
-        buffer.write(right)
+        if not (is_atomic(typ.right) or isinstance(typ.right, ProductType)):
+            right = f"({right})"
 
-        if right_parenthesized:
-            buffer.write(")")
+        return f"{left}, {right}"
 
-        return buffer.getvalue()
+    # Dispatch table over the concrete node classes; built after the
+    # methods so it can reference them directly.
+    _DISPATCH: typing.ClassVar = {
+        ApplicationType: visit_application_type,
+        PrimitiveType: visit_primitive_type,
+        ProductType: visit_product_type,
+    }
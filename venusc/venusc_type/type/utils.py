@@ -5,6 +5,7 @@ Utils for the type tree.
 from __future__ import annotations
 
 import typing
+import weakref
 
 from .kind import PrimitiveKind
 from .lib import ApplicationType
@@ -14,8 +15,27 @@ from .lib import SumType
 from .lib import Type
 from .lib import TypeVariable
 
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Enum members bound as module-level names once, so the predicates do
+# one global load per call instead of an attribute lookup on the enum
+# class (which goes through EnumMeta) on top of it.
+_NEVER_KIND: typing.Final = PrimitiveKind.NEVER
+_UNIT_KIND: typing.Final = PrimitiveKind.UNIT
+
+# The two identity elements of the type algebra come up on every
+# collapse in `simplify`; interning them as module-level singletons
+# skips the allocation and gives the predicates an identity fast path.
+_NEVER: typing.Final = PrimitiveType(_NEVER_KIND)
+_UNIT: typing.Final = PrimitiveType(_UNIT_KIND)
+
 # *- Predicates -* #
 
+# The hierarchy is closed, so atomicity is just membership in this
+# tuple; `isinstance` against it is a single C-level call.
+_ATOMIC_TYPES: typing.Final = (PrimitiveType, TypeVariable)
+
 
 def is_atomic(typ: Type) -> bool:
     """
@@ -26,11 +46,7 @@ def is_atomic(typ: Type) -> bool:
     bool
     """
 
-    match typ:
-        case ApplicationType() | ProductType() | SumType():
-            return False
-        case PrimitiveType() | TypeVariable():
-            return True
+    return isinstance(typ, _ATOMIC_TYPES)
 
 
 def is_never(typ: Type) -> typing.TypeGuard[PrimitiveType]:
@@ -42,7 +58,9 @@ def is_never(typ: Type) -> typing.TypeGuard[PrimitiveType]:
     bool
     """
 
-    return isinstance(typ, PrimitiveType) and typ.kind is PrimitiveKind.NEVER
+    return typ is _NEVER or (
+        isinstance(typ, PrimitiveType) and typ.kind is _NEVER_KIND
+    )
 
 
 def is_unit(typ: Type) -> typing.TypeGuard[PrimitiveType]:
@@ -54,7 +72,9 @@ def is_unit(typ: Type) -> typing.TypeGuard[PrimitiveType]:
     bool
     """
 
-    return isinstance(typ, PrimitiveType) and typ.kind is PrimitiveKind.UNIT
+    return typ is _UNIT or (
+        isinstance(typ, PrimitiveType) and typ.kind is _UNIT_KIND
+    )
 
 
 # *- Constructors -* #
@@ -75,33 +95,39 @@ def make_application_from_signature(
     ##########################################################################
     # Process                                                                #
     # -------                                                                #
-    # 1. We start by creating `first -> return_type`.                        #
-    # 2. In reverse order (as `->` is right-associative), we insert the      #
-    #    last parameter as the first of the returned application.            #
-    #      `first -> (last -> return_type)`                                  #
-    # 3. We continue to do that for each parameter:                          #
-    #      `first -> (second_last -> (last -> return_type))`                 #
-    # And so on.                                                             #
+    # As `->` is right-associative, the signature is a right fold: we        #
+    # start from the innermost application `last -> return_type` and walk    #
+    # the remaining parameters backwards, each step wrapping the             #
+    # accumulator:                                                           #
+    #      `second_last -> (last -> return_type)`                            #
+    # And so on, until `first -> (second -> ... -> return_type)`.            #
     ##########################################################################
 
-    first, *rest = parameters
-    result = ApplicationType(first, return_type)
+    # Single-parameter signatures — the common arity — are one wrap
+    # with no fold state at all.
+    if len(parameters) == 1:
+        return ApplicationType(parameters[0], return_type)
 
-    for parameter in reversed(rest):
-        result = ApplicationType(
-            first,
-            ApplicationType(parameter, result.applied),
-        )
+    result = ApplicationType(parameters[-1], return_type)
+
+    # A backward index walk: `reversed(parameters[:-1])` would copy the
+    # tuple and then step an iterator object per parameter.
+    for index in range(len(parameters) - 2, -1, -1):
+        result = ApplicationType(parameters[index], result)
 
     return result
 
 
 def make_factorial_type(*types: Type) -> Type:
     """
-    Recursively create a new factorial type.
+    Create a new factorial type.
 
     Formally, a factorial type is the result of a product fold over a list of
-    types.
+    types. The fold runs as a backwards loop — the product is
+    right-associative — rather than by recursion, so wide tuples cost
+    neither a call frame nor an argument tuple per element; each step
+    only simplifies the incoming term, as the accumulator is simplified
+    by construction.
 
     Returns
     -------
@@ -113,69 +139,361 @@ def make_factorial_type(*types: Type) -> Type:
         If several types are provided.
     """
 
-    match types:
-        case ():
-            return PrimitiveType(PrimitiveKind.UNIT)
-        case (first,):
-            return first
-        case _:
-            first, *rest = types
+    if not types:
+        return _UNIT
 
-            return simplify(ProductType(first, make_factorial_type(*rest)))
+    if len(types) == 1:
+        return types[0]
+
+    accumulator = simplify(types[-1])
+
+    for typ in reversed(types[:-1]):
+        sleft = simplify(typ)
+        collapsed = _collapse_product(sleft, accumulator)
+
+        if collapsed is None:
+            accumulator = ProductType(sleft, accumulator)
+        else:
+            accumulator = collapsed
+
+    return accumulator
 
 
 # *- Solving utils -* #
 
+# Trees already returned by `simplify`, so defensive re-simplification
+# — the usual calling pattern whenever a pass manipulates a type —
+# costs one dict probe instead of a full traversal. The type nodes are
+# frozen and slotted, so the mark cannot live on them; it lives here,
+# keyed on identity with weak values so an entry dies with its node and
+# a recycled id can never alias a dead one.
+_SIMPLIFIED: typing.Final[weakref.WeakValueDictionary[int, Type]] = (
+    weakref.WeakValueDictionary()
+)
+
 
-def simplify(typ: Type) -> Type:
+def _collapse_product(sleft: Type, sright: Type) -> Type | None:
+    """
+    Apply the product identity rules to two already-simplified terms.
+
+    Shared by `simplify` and `make_factorial_type`, whose fold feeds an
+    accumulator that is simplified by construction and must not be
+    re-traversed.
+
+    Returns
+    -------
+    Type
+        The collapsed product, if a rule applies.
+    None
+        Otherwise.
+    """
+
+    # If any of the terms is the empty type, then the product type can
+    # be simplified to the empty type
+    if is_never(sleft) or is_never(sright):
+        return _NEVER
+
+    # If the right term is the identity (unit type), then the product
+    # can be simplified to the left term
+    if is_unit(sright):
+        return sleft
+
+    # If the left term is the identity (unit type), then the product
+    # can be simplified to the right term
+    if is_unit(sleft):
+        return sright
+
+    return None
+
+
+def simplify(typ: Type) -> Type:  # noqa: C901, PLR0912, PLR0915
     """
     Simplify the type `typ` by removing identities and redundant terms.
 
+    The traversal is post-order over an explicit stack rather than
+    recursive, so the cost per node is one loop iteration instead of a
+    Python call frame and deep types cannot hit the recursion limit.
+    Subtrees that appear several times in `typ` are simplified once.
+
     Returns
     -------
     Type
         The simplied version of the type.
     """
 
-    match typ:
-        case ApplicationType(parameter, applied):
-            return ApplicationType(simplify(parameter), simplify(applied))
-        case ProductType(left, right):
-            sleft = simplify(left)
-            sright = simplify(right)
-
-            # If any of the terms is the empty type, then the product type can
-            # be simplified to the empty type
-            if is_never(sleft) or is_never(sright):
-                simplified = PrimitiveType(PrimitiveKind.NEVER)
-            # If the right term is the identity (unit type), then the product
-            # can be simplified to the left term
-            elif is_unit(sright):
-                simplified = sleft
-            # If the left term is the identity (unit type), then the product can
-            # be simplified to the right term
-            elif is_unit(sleft):
-                simplified = sright
+    # Leaves are their own simplified form; two pointer comparisons
+    # send them back before any traversal state gets allocated.
+    t = type(typ)
+
+    if t is PrimitiveType or t is TypeVariable:
+        return typ
+
+    # Trees this function already returned are simplified by
+    # construction; hand them back without walking them again.
+    if _SIMPLIFIED.get(id(typ)) is typ:
+        return typ
+
+    # Each compound node passes through the stack twice: once to
+    # schedule its children ("visit"), once to be rebuilt from their
+    # simplified forms ("combine"), which by then sit on top of
+    # `results`.
+    stack: list[tuple[Type, bool]] = [(typ, False)]
+    results: list[Type] = []
+    # Subtrees shared between branches (common in curried application
+    # chains) are simplified once and replayed from here on the next
+    # visit. Keyed on identity: the memo only lives for this call, and
+    # every key is kept alive by the input tree, so ids cannot be
+    # recycled under it.
+    memo: dict[int, Type] = {}
+
+    while stack:
+        node, combine = stack.pop()
+
+        if not combine and (cached := memo.get(id(node))) is not None:
+            results.append(cached)
+
+            continue
+
+        # A `type is` ladder over the (closed, final) hierarchy: one
+        # pointer comparison per branch, where a class pattern would
+        # pay an `isinstance` and a `__match_args__` decode per node.
+        t = type(node)
+
+        if t is ApplicationType:
+            if combine:
+                sapplied = results.pop()
+                sparameter = results.pop()
+
+                # If both sides came back unchanged, the node is
+                # already its own simplified form
+                if sparameter is node.parameter and sapplied is node.applied:
+                    simplified = node
+                else:
+                    simplified = ApplicationType(sparameter, sapplied)
+
+                memo[id(node)] = simplified
+
+                results.append(simplified)
+            else:
+                stack.extend((
+                    (node, True),
+                    (node.applied, False),
+                    (node.parameter, False),
+                ))
+        elif t is ProductType:
+            if not combine:
+                stack.extend((
+                    (node, True),
+                    (node.right, False),
+                    (node.left, False),
+                ))
+
+                continue
+
+            sright = results.pop()
+            sleft = results.pop()
+
+            collapsed = _collapse_product(sleft, sright)
+
+            if collapsed is not None:
+                simplified = collapsed
+            # If both terms came back unchanged, the node is already
+            # its own simplified form
+            elif sleft is node.left and sright is node.right:
+                simplified = node
             else:
                 simplified = ProductType(sleft, sright)
 
-            return simplified
+            memo[id(node)] = simplified
+            results.append(simplified)
+        elif t is SumType:
+            if not combine:
+                stack.extend((
+                    (node, True),
+                    (node.right, False),
+                    (node.left, False),
+                ))
 
-        case SumType(left, right):
-            sleft = simplify(left)
-            sright = simplify(right)
+                continue
 
-            # If the right term is the identity (empty type), then the sum can
-            # be simplified to the left term
+            sright = results.pop()
+            sleft = results.pop()
+
+            # If the right term is the identity (empty type), then the
+            # sum can be simplified to the left term
             if is_never(sright):
                 simplified = sleft
-            # If the left term is the identity (empty type), then the sum can
-            # be simplified to the right term
+            # If the left term is the identity (empty type), then the
+            # sum can be simplified to the right term
             elif is_never(sleft):
                 simplified = sright
+            # If both terms came back unchanged, the node is already
+            # its own simplified form
+            elif sleft is node.left and sright is node.right:
+                simplified = node
             else:
                 simplified = SumType(sleft, sright)
 
-            return simplified
-        case PrimitiveType() | TypeVariable():
-            return typ
+            memo[id(node)] = simplified
+            results.append(simplified)
+        else:
+            memo[id(node)] = node
+            results.append(node)
+
+    simplified = results.pop()
+
+    if not is_atomic(simplified):
+        _SIMPLIFIED[id(simplified)] = simplified
+
+    return simplified
+
+
+# The shape of a type: its tree of concrete classes, with primitive
+# leaves refined by their kind (the identity rules key on it) and type
+# variables collapsed to one tag (they never trigger a rule).
+type _Shape = PrimitiveKind | str | tuple[str, _Shape, _Shape]
+
+# Compiled simplifiers keyed by the shape they were generated for.
+_SHAPE_SIMPLIFIERS: typing.Final[dict[_Shape, Callable[[Type], Type]]] = {}
+
+
+def _shape_of(typ: Type) -> _Shape:
+    t = type(typ)
+
+    if t is ApplicationType:
+        return ("app", _shape_of(typ.parameter), _shape_of(typ.applied))
+
+    if t is ProductType:
+        return ("prod", _shape_of(typ.left), _shape_of(typ.right))
+
+    if t is SumType:
+        return ("sum", _shape_of(typ.left), _shape_of(typ.right))
+
+    if t is PrimitiveType:
+        return typ.kind
+
+    return "var"
+
+
+def _emit_simplified(  # noqa: C901, PLR0911, PLR0912
+    shape: _Shape,
+    path: str,
+) -> tuple[str, str]:
+    """
+    Partially evaluate the identity rules against `shape`.
+
+    `path` is the expression reaching the corresponding subtree of the
+    runtime argument (e.g. `typ.left.applied`).
+
+    Returns
+    -------
+    (str, str)
+        The expression computing the simplified subtree, and its
+        evaluation as "never", "unit" or "other" — the rules only need
+        that much to fire at generation time.
+    """
+
+    if isinstance(shape, PrimitiveKind):
+        if shape is _NEVER_KIND:
+            return ("_NEVER", "never")
+
+        if shape is _UNIT_KIND:
+            return ("_UNIT", "unit")
+
+        return (path, "other")
+
+    if shape == "var":
+        return (path, "other")
+
+    tag, left_shape, right_shape = shape
+
+    if tag == "app":
+        parameter, _ = _emit_simplified(left_shape, f"{path}.parameter")
+        applied, _ = _emit_simplified(right_shape, f"{path}.applied")
+
+        # Both sides simplify to themselves: so does the node
+        if parameter == f"{path}.parameter" and applied == f"{path}.applied":
+            return (path, "other")
+
+        return (f"ApplicationType({parameter}, {applied})", "other")
+
+    left, left_tag = _emit_simplified(left_shape, f"{path}.left")
+    right, right_tag = _emit_simplified(right_shape, f"{path}.right")
+
+    if tag == "prod":
+        if left_tag == "never" or right_tag == "never":
+            return ("_NEVER", "never")
+
+        if right_tag == "unit":
+            return (left, left_tag)
+
+        if left_tag == "unit":
+            return (right, right_tag)
+    else:
+        if right_tag == "never":
+            return (left, left_tag)
+
+        if left_tag == "never":
+            return (right, right_tag)
+
+    if left == f"{path}.left" and right == f"{path}.right":
+        return (path, "other")
+
+    constructor = "ProductType" if tag == "prod" else "SumType"
+
+    return (f"{constructor}({left}, {right})", "other")
+
+
+def _compile_shape_simplifier(shape: _Shape) -> Callable[[Type], Type]:
+    expression, _ = _emit_simplified(shape, "typ")
+
+    namespace: dict[str, typing.Any] = {
+        "ApplicationType": ApplicationType,
+        "ProductType": ProductType,
+        "SumType": SumType,
+        "_NEVER": _NEVER,
+        "_UNIT": _UNIT,
+    }
+
+    exec(  # noqa: S102
+        compile(
+            f"def specialized(typ):\n    return {expression}",
+            "<simplify_shaped>",
+            "exec",
+        ),
+        namespace,
+    )
+
+    function = namespace["specialized"]
+    function.__qualname__ = "simplify_shaped.<specialized>"
+
+    return function
+
+
+def simplify_shaped(typ: Type) -> Type:
+    """
+    Simplify `typ` through a simplifier compiled for its shape.
+
+    The first call for a given shape partially evaluates the identity
+    rules against it and compiles the straight-line remainder — the
+    attribute loads and constructor calls that survive, with no
+    dispatch left. Later calls on structurally identical trees reuse
+    it, paying only the shape-key walk. Worthwhile when the same
+    moderate-size shapes recur many times; one-off or very deep trees
+    are better served by `simplify`.
+
+    Returns
+    -------
+    Type
+        The simplied version of the type.
+    """
+
+    shape = _shape_of(typ)
+    function = _SHAPE_SIMPLIFIERS.get(shape)
+
+    if function is None:
+        function = _SHAPE_SIMPLIFIERS[shape] = _compile_shape_simplifier(
+            shape,
+        )
+
+    return function(typ)